@@ -88,9 +88,9 @@ class SimplePriceFetcher:
             
             # Setup event handlers with symbol mapping support
             if config_format == 'symbol_ticker':
-                exchange.on('price_update', lambda data, ex=exchange_name: self._handle_price_update_with_mapping(data, ex, config_data['pairs']))
+                exchange.on('price_batch', lambda batch, ex=exchange_name: self._handle_price_batch_with_mapping(batch, ex, config_data['pairs']))
             else:
-                exchange.on('price_update', self.price_manager.update_price)
+                exchange.on('price_batch', self.price_manager.update_prices)
             
             try:
                 await exchange.connect()
@@ -98,28 +98,25 @@ class SimplePriceFetcher:
                 
                 if config_format == 'symbol_ticker':
                     # symbols is a list of dicts with display_symbol and ticker
-                    for i, symbol_data in enumerate(symbols):
-                        ticker = symbol_data['ticker']
-                        await exchange.subscribe(ticker)
-                        # Increase delay for exchanges with many symbols
-                        delay = 0.5 if len(symbols) > 30 else 0.2
-                        if i < len(symbols) - 1:
-                            await asyncio.sleep(delay)
+                    tickers = [symbol_data['ticker'] for symbol_data in symbols]
                 else:
                     # Legacy format - symbols is a list of strings
-                    for i, symbol in enumerate(symbols):
-                        await exchange.subscribe(symbol)
-                        # Increase delay for exchanges with many symbols
-                        delay = 0.5 if len(symbols) > 30 else 0.2
-                        if i < len(symbols) - 1:
-                            await asyncio.sleep(delay)
+                    tickers = list(symbols)
+                
+                # Slow subscriptions down for exchanges with many symbols (per-message pacing, also between chunks)
+                exchange.subscribe_interval = 0.5 if len(tickers) > 30 else 0.2
+                await exchange.subscribe_many(tickers)
                     
             except Exception as e:
                 logger.error(f"Failed to connect to {exchange_name}: {e}")
     
-    def _handle_price_update_with_mapping(self, data, exchange_name, pairs):
-        """Handle price updates with ticker to display symbol mapping."""
-        ticker = data['symbol']
+    def _handle_price_batch_with_mapping(self, batch, exchange_name, pairs):
+        """Handle a batch of price updates with ticker to display symbol mapping."""
+        self.price_manager.update_prices([self._map_display_symbol(data, exchange_name, pairs) for data in batch])
+    
+    def _map_display_symbol(self, data, exchange_name, pairs):
+        """Return the price update with its ticker replaced by the configured display symbol."""
+        ticker = data.symbol
         
         # Find the display symbol for this ticker and exchange
         display_symbol = None
@@ -130,16 +127,11 @@ class SimplePriceFetcher:
         
         if display_symbol:
             # Update the data with display symbol
-            updated_data = data.copy()
-            updated_data['symbol'] = display_symbol
-            updated_data['ticker'] = ticker  # Keep original ticker for reference
-            
-            # Pass to price manager
-            self.price_manager.update_price(updated_data)
-        else:
-            # Fallback to original symbol if no mapping found
-            logger.warning(f"No display symbol mapping found for {ticker} on {exchange_name}")
-            self.price_manager.update_price(data)
+            return data._replace(symbol=display_symbol)
+        
+        # Fallback to original symbol if no mapping found
+        logger.warning(f"No display symbol mapping found for {ticker} on {exchange_name}")
+        return data
     
     def get_api(self):
         """Get API interface."""
@@ -150,6 +142,7 @@ class SimplePriceFetcher:
             'get_market_summary': self.price_manager.get_market_summary,
             'get_best_prices': self.price_manager.get_best_prices,
             'check_arbitrage_opportunities': self.price_manager.check_arbitrage_opportunities,
+            'check_all_arbitrage_opportunities': self.price_manager.check_all_arbitrage_opportunities,
             'get_arbitrage_alert_status': self.price_manager.get_arbitrage_alert_status
         }
 
@@ -375,16 +368,9 @@ async def get_arbitrage_opportunities():
         return {"error": "Price fetcher not initialized"}
     
     api = price_fetcher.get_api()
-    all_opportunities = []
-    
-    # Get opportunities for each symbol
-    symbols = api['get_market_summary']()['symbols']
-    for symbol in symbols:
-        opportunities = api['check_arbitrage_opportunities'](symbol, 0.05)  # 0.05% minimum spread
-        all_opportunities.extend(opportunities)
     
-    # Sort by potential profit
-    all_opportunities.sort(key=lambda x: x['potential_profit'], reverse=True)
+    # Opportunities across all symbols, sorted by potential profit
+    all_opportunities = api['check_all_arbitrage_opportunities'](0.05)  # 0.05% minimum spread
     
     return {
         "opportunities": all_opportunities[:20],  # Top 20 opportunities
@@ -10,6 +10,11 @@ from typing import Dict, List, Set
 
 import click
 
+try:
+    import uvloop
+except ImportError:  # uvloop is unavailable on Windows
+    uvloop = None
+
 from src.utils.input_parser import InputParser
 from src.price_manager import PriceManager
 from src.exchanges.binance_exchange import BinanceExchange
@@ -135,9 +140,9 @@ class CryptoFuturesPriceFetcher:
             
             # Setup event handlers with symbol mapping support
             if config_format == 'symbol_ticker':
-                exchange.on('price_update', lambda data, ex=exchange_name: self._handle_price_update_with_mapping(data, ex, config_data['pairs']))
+                exchange.on('price_batch', lambda batch, ex=exchange_name: self._handle_price_batch_with_mapping(batch, ex, config_data['pairs']))
             else:
-                exchange.on('price_update', self.price_manager.update_price)
+                exchange.on('price_batch', self.price_manager.update_prices)
             
             exchange.on('error', lambda error, ex=exchange_name: logger.error(f"Exchange {ex} error: {error}"))
             exchange.on('max_reconnect_attempts_reached', 
@@ -160,32 +165,30 @@ class CryptoFuturesPriceFetcher:
             await exchange.connect()
             self.active_connections.add(exchange.name)
             
-            # Subscribe to symbols with small delays to avoid rate limits
+            # Subscribe to symbols; exchanges batch or pace the sends to avoid rate limits
             if config_format == 'symbol_ticker':
                 # symbols is a list of dicts with display_symbol and ticker
-                for symbol_data in symbols:
-                    try:
-                        ticker = symbol_data['ticker']
-                        await exchange.subscribe(ticker)
-                        await asyncio.sleep(0.1)  # Small delay between subscriptions
-                    except Exception as e:
-                        logger.error(f"Failed to subscribe to {symbol_data} on {exchange.name}: {e}")
+                tickers = [symbol_data['ticker'] for symbol_data in symbols]
             else:
                 # Legacy format - symbols is a list of strings
-                for symbol in symbols:
-                    try:
-                        await exchange.subscribe(symbol)
-                        await asyncio.sleep(0.1)  # Small delay between subscriptions
-                    except Exception as e:
-                        logger.error(f"Failed to subscribe to {symbol} on {exchange.name}: {e}")
+                tickers = list(symbols)
+            
+            try:
+                await exchange.subscribe_many(tickers)
+            except Exception as e:
+                logger.error(f"Failed to subscribe to {tickers} on {exchange.name}: {e}")
             
         except Exception as e:
             logger.error(f"Failed to connect to {exchange.name}: {e}")
             raise
     
-    def _handle_price_update_with_mapping(self, data, exchange_name, pairs):
-        """Handle price updates with ticker to display symbol mapping."""
-        ticker = data['symbol']
+    def _handle_price_batch_with_mapping(self, batch, exchange_name, pairs):
+        """Handle a batch of price updates with ticker to display symbol mapping."""
+        self.price_manager.update_prices([self._map_display_symbol(data, exchange_name, pairs) for data in batch])
+    
+    def _map_display_symbol(self, data, exchange_name, pairs):
+        """Return the price update with its ticker replaced by the configured display symbol."""
+        ticker = data.symbol
         
         # Find the display symbol for this ticker and exchange
         display_symbol = None
@@ -196,16 +199,11 @@ class CryptoFuturesPriceFetcher:
         
         if display_symbol:
             # Update the data with display symbol
-            updated_data = data.copy()
-            updated_data['symbol'] = display_symbol
-            updated_data['ticker'] = ticker  # Keep original ticker for reference
-            
-            # Pass to price manager
-            self.price_manager.update_price(updated_data)
-        else:
-            # Fallback to original symbol if no mapping found
-            logger.warning(f"No display symbol mapping found for {ticker} on {exchange_name}")
-            self.price_manager.update_price(data)
+            return data._replace(symbol=display_symbol)
+        
+        # Fallback to original symbol if no mapping found
+        logger.warning(f"No display symbol mapping found for {ticker} on {exchange_name}")
+        return data
     
     def _handle_exchange_failure(self, exchange_name: str):
         """Handle exchange connection failure."""
@@ -296,7 +294,8 @@ class CryptoFuturesPriceFetcher:
             'get_all_prices': self.price_manager.get_all_prices,
             'get_best_prices': self.price_manager.get_best_prices,
             'get_market_summary': self.price_manager.get_market_summary,
-            'check_arbitrage_opportunities': self.price_manager.check_arbitrage_opportunities
+            'check_arbitrage_opportunities': self.price_manager.check_arbitrage_opportunities,
+            'check_all_arbitrage_opportunities': self.price_manager.check_all_arbitrage_opportunities
         }
 
 @click.command()
@@ -319,6 +318,10 @@ def main(input_file: str, summary_interval: int, verbose: bool):
         logger.error(f"Input file not found: {input_path}")
         sys.exit(1)
     
+    # Use uvloop's faster event loop for WebSocket I/O when it is installed
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     # Create and run fetcher
     fetcher = CryptoFuturesPriceFetcher()
     
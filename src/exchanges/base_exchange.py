@@ -3,43 +3,98 @@ import json
 import logging
 import time
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, Set, Any
+from typing import Callable, Dict, FrozenSet, Hashable, List, NamedTuple, Optional, Set, Any, Union
+import orjson
 import websockets
 from websockets.exceptions import ConnectionClosed, WebSocketException
 
 logger = logging.getLogger(__name__)
 
+# Stand-in for the request id in cached message templates, replaced on each render
+ID_PLACEHOLDER = '__ID__'
+_ID_PLACEHOLDER_JSON = '"%s"' % ID_PLACEHOLDER
+
+class PriceUpdate(NamedTuple):
+    """Normalized price update emitted on 'price_update'."""
+    exchange: str
+    symbol: str
+    price: float
+    bid: Optional[float]
+    ask: Optional[float]
+    timestamp: int
+
 class BaseExchange(ABC):
     def __init__(self, name: str):
         self.name = name
         self.ws = None
+        # Tracks whether self.ws is open, so sends don't have to query ws.closed
+        self._ws_open = False
         self.is_connected = False
         self.reconnect_interval = 5.0
         self.max_reconnect_attempts = 10
         self.reconnect_attempts = 0
-        self.subscribed_symbols: Set[str] = set()
+        # Delay between per-symbol subscriptions in subscribe_many, to stay under rate limits
+        self.subscribe_interval = 0.1
+        # Sends pipelined at once by send_in_chunks; the pause between chunks keeps the same average rate
+        self.subscribe_chunk_size = 10
+        # Mutable set for (un)subscribe; hot paths read the immutable snapshot
+        self._subscribed_set: Set[str] = set()
+        self.subscribed_symbols: FrozenSet[str] = frozenset()
         self.ping_task = None
         self.listen_task = None
         self.event_callbacks = {}
         self.is_shutting_down = False
+        # Serialized control messages by key, see render_cached_message
+        self._message_cache: Dict[Hashable, str] = {}
+        # Latest price update per symbol, buffered for the next 'price_batch' event
+        self.price_batch_window = 0.005
+        self._pending_updates: Dict[str, PriceUpdate] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
     
     def on(self, event: str, callback):
         """Register event callback."""
-        if event not in self.event_callbacks:
-            self.event_callbacks[event] = []
-        self.event_callbacks[event].append(callback)
+        # Whether the callback is a coroutine function is decided once here, not on every emit
+        self.event_callbacks.setdefault(event, []).append((callback, asyncio.iscoroutinefunction(callback)))
     
     def emit(self, event: str, data: Any):
         """Emit event to registered callbacks."""
-        if event in self.event_callbacks:
-            for callback in self.event_callbacks[event]:
-                try:
-                    if asyncio.iscoroutinefunction(callback):
-                        asyncio.create_task(callback(data))
-                    else:
-                        callback(data)
-                except Exception as e:
-                    logger.error(f"Error in event callback for {event}: {e}")
+        callbacks = self.event_callbacks.get(event)
+        if callbacks is None:
+            return
+        
+        for callback, is_coroutine in callbacks:
+            try:
+                if is_coroutine:
+                    asyncio.create_task(callback(data))
+                else:
+                    callback(data)
+            except Exception as e:
+                logger.error(f"Error in event callback for {event}: {e}")
+    
+    def publish_price_update(self, price_data: PriceUpdate):
+        """Deliver a price update to 'price_update' and 'price_batch' listeners.
+        
+        'price_update' listeners get each update immediately. For 'price_batch' listeners, updates
+        are buffered for price_batch_window seconds and emitted together as one list, keeping only
+        the latest update per symbol so bursts collapse into a single update each.
+        """
+        if 'price_update' in self.event_callbacks:
+            self.emit('price_update', price_data)
+        
+        if 'price_batch' in self.event_callbacks:
+            self._pending_updates[price_data.symbol] = price_data
+            if self._flush_handle is None:
+                self._flush_handle = asyncio.get_running_loop().call_later(
+                    self.price_batch_window, self._flush_price_updates
+                )
+    
+    def _flush_price_updates(self):
+        """Emit buffered price updates as a single 'price_batch' event."""
+        self._flush_handle = None
+        batch = self._pending_updates
+        self._pending_updates = {}
+        if batch:
+            self.emit('price_batch', list(batch.values()))
     
     async def connect(self):
         """Connect to the WebSocket endpoint."""
@@ -61,6 +116,7 @@ class BaseExchange(ABC):
                 close_timeout=10
             )
             
+            self._ws_open = True
             self.is_connected = True
             self.reconnect_attempts = 0
             logger.info(f"Connected to {self.name}")
@@ -82,30 +138,13 @@ class BaseExchange(ABC):
                     break
                     
                 try:
-                    # Handle string messages (parse JSON)
-                    if isinstance(message, str):
-                        try:
-                            data = json.loads(message)
-                        except json.JSONDecodeError as e:
-                            logger.error(f"Failed to parse JSON message from {self.name}: {e}")
-                            continue
-                    # Handle binary messages
-                    elif isinstance(message, bytes):
-                        try:
-                            data = json.loads(message.decode('utf-8'))
-                        except (json.JSONDecodeError, UnicodeDecodeError) as e:
-                            logger.error(f"Failed to parse binary message from {self.name}: {e}")
-                            continue
-                    # Message is already parsed (shouldn't happen but handle gracefully)
-                    else:
-                        data = message
+                    data = self.decode_message(message)
                     
-                    # Only call handle_message if we have valid data
+                    # Only call a handler if we have valid data
                     if data is not None:
-                        await self.handle_message(data)
+                        await self.select_handler(message)(data)
                     else:
                         logger.debug(f"Received None message from {self.name}")
-                        
                 except Exception as e:
                     logger.debug(f"Message handling issue from {self.name}: {e}")
                     # Only log as error if it's not a known message format issue
@@ -122,8 +161,35 @@ class BaseExchange(ABC):
             logger.error(f"Unexpected error in message listener for {self.name}: {e}")
             await self._handle_disconnect()
     
+    def decode_message(self, raw):
+        """Decode a raw WebSocket frame. Returns None if the frame can't be parsed."""
+        # Handle string messages (parse JSON)
+        if isinstance(raw, str):
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError as e:
+                logger.error(f"Failed to parse JSON message from {self.name}: {e}")
+                return None
+        # Handle binary messages (orjson parses UTF-8 bytes directly)
+        elif isinstance(raw, bytes):
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError as e:
+                logger.error(f"Failed to parse binary message from {self.name}: {e}")
+                return None
+        # Message is already parsed (shouldn't happen but handle gracefully)
+        return raw
+    
+    def select_handler(self, raw) -> Callable[[Any], Any]:
+        """Return the coroutine function that handles a decoded frame.
+        
+        Override to pick a handler from the raw frame instead of inspecting the decoded message.
+        """
+        return self.handle_message
+    
     async def _handle_disconnect(self):
         """Handle WebSocket disconnection."""
+        self._ws_open = False
         self.is_connected = False
         
         if self.ping_task:
@@ -139,8 +205,7 @@ class BaseExchange(ABC):
             try:
                 await self.connect()
                 # Re-subscribe to all symbols
-                for symbol in self.subscribed_symbols.copy():
-                    await self.subscribe(symbol)
+                await self.subscribe_many(list(self.subscribed_symbols))
             except Exception as e:
                 logger.error(f"Reconnection failed for {self.name}: {e}")
         else:
@@ -153,10 +218,10 @@ class BaseExchange(ABC):
         if not self.is_connected:
             raise ConnectionError(f"Not connected to {self.name}")
         
-        self.subscribed_symbols.add(symbol)
+        self._add_subscription(symbol)
         subscribe_message = self.get_subscribe_message(symbol)
         
-        await self.ws.send(json.dumps(subscribe_message))
+        await self.send_message(subscribe_message)
         logger.info(f"Subscribed to {symbol} on {self.name}")
     
     async def unsubscribe(self, symbol: str):
@@ -164,12 +229,74 @@ class BaseExchange(ABC):
         if not self.is_connected:
             return
         
-        self.subscribed_symbols.discard(symbol)
+        self._remove_subscription(symbol)
         unsubscribe_message = self.get_unsubscribe_message(symbol)
         
-        await self.ws.send(json.dumps(unsubscribe_message))
+        await self.send_message(unsubscribe_message)
         logger.info(f"Unsubscribed from {symbol} on {self.name}")
     
+    async def subscribe_many(self, symbols: List[str]):
+        """Subscribe to several symbols, one at a time with subscribe_interval between sends.
+        
+        Exchanges that can batch subscriptions override this.
+        """
+        for i, symbol in enumerate(symbols):
+            try:
+                await self.subscribe(symbol)
+            except Exception as e:
+                logger.error(f"Failed to subscribe to {symbol} on {self.name}: {e}")
+            
+            if i < len(symbols) - 1:
+                await asyncio.sleep(self.subscribe_interval)
+    
+    async def send_in_chunks(self, messages: List[str], send: Callable[[str], Any]):
+        """Send messages concurrently within chunks, pausing subscribe_interval per message between chunks."""
+        size = self.subscribe_chunk_size
+        for start in range(0, len(messages), size):
+            if start:
+                await asyncio.sleep(self.subscribe_interval * size)
+            await asyncio.gather(*(send(message) for message in messages[start:start + size]))
+    
+    def render_cached_message(self, key: Hashable, build: Callable[[], Dict], req_id: Optional[int] = None) -> str:
+        """Return a control message as JSON text, serializing build() only the first time key is seen.
+        
+        Messages that carry a request id use ID_PLACEHOLDER as the id value; it is replaced with req_id.
+        """
+        template = self._message_cache.get(key)
+        if template is None:
+            template = self._message_cache[key] = orjson.dumps(build()).decode('utf-8')
+        
+        if req_id is None:
+            return template
+        return template.replace(_ID_PLACEHOLDER_JSON, str(req_id))
+    
+    def _add_subscription(self, symbol: str):
+        """Track a subscribed symbol and refresh the subscribed_symbols snapshot."""
+        self._subscribed_set.add(symbol)
+        self.subscribed_symbols = frozenset(self._subscribed_set)
+    
+    def _remove_subscription(self, symbol: str):
+        """Stop tracking a symbol and refresh the subscribed_symbols snapshot."""
+        self._subscribed_set.discard(symbol)
+        self.subscribed_symbols = frozenset(self._subscribed_set)
+    
+    def _clear_subscriptions(self):
+        """Stop tracking all symbols."""
+        self._subscribed_set.clear()
+        self.subscribed_symbols = frozenset()
+    
+    async def send_message(self, message: Union[Dict, str, bytes]):
+        """Send a message as a text frame, serializing dicts to JSON.
+        
+        Pre-serialized str/bytes messages are sent as-is so exchanges can cache them.
+        """
+        if isinstance(message, (bytes, bytearray)):
+            message = message.decode('utf-8')
+        elif not isinstance(message, str):
+            message = json.dumps(message)
+        
+        await self.ws.send(message)
+    
     async def start_ping(self):
         """Start periodic ping messages."""
         async def ping_loop():
@@ -177,7 +304,7 @@ class BaseExchange(ABC):
                 try:
                     ping_message = self.get_ping_message()
                     if ping_message:
-                        await self.ws.send(json.dumps(ping_message))
+                        await self.send_message(ping_message)
                     else:
                         await self.ws.ping()
                     
@@ -200,27 +327,32 @@ class BaseExchange(ABC):
             self.listen_task.cancel()
             self.listen_task = None
         
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_price_updates()
+        
         if self.ws and not self.ws.closed:
             await self.ws.close()
         
+        self._ws_open = False
         self.is_connected = False
-        self.subscribed_symbols.clear()
+        self._clear_subscriptions()
         logger.info(f"Disconnected from {self.name}")
     
     def normalize_symbol(self, symbol: str) -> str:
         """Normalize symbol format."""
         return symbol.upper()
     
-    def format_price_data(self, symbol: str, price: float, bid: Optional[float], ask: Optional[float], timestamp: Optional[int] = None) -> Dict:
+    def format_price_data(self, symbol: str, price: float, bid: Optional[float], ask: Optional[float], timestamp: Optional[int] = None) -> PriceUpdate:
         """Format price data for emission."""
-        return {
-            'exchange': self.name,
-            'symbol': self.normalize_symbol(symbol),
-            'price': float(price),
-            'bid': float(bid) if bid is not None else None,
-            'ask': float(ask) if ask is not None else None,
-            'timestamp': timestamp or int(time.time() * 1000)
-        }
+        return PriceUpdate(
+            self.name,
+            self.normalize_symbol(symbol),
+            float(price),
+            float(bid) if bid is not None else None,
+            float(ask) if ask is not None else None,
+            timestamp or int(time.time() * 1000)
+        )
     
     # Abstract methods that must be implemented by subclasses
     @abstractmethod
@@ -229,13 +361,13 @@ class BaseExchange(ABC):
         pass
     
     @abstractmethod
-    def get_subscribe_message(self, symbol: str) -> Dict:
-        """Return the subscription message for a symbol."""
+    def get_subscribe_message(self, symbol: str) -> Union[Dict, str]:
+        """Return the subscription message for a symbol (dict or pre-serialized JSON)."""
         pass
     
     @abstractmethod
-    def get_unsubscribe_message(self, symbol: str) -> Dict:
-        """Return the unsubscription message for a symbol."""
+    def get_unsubscribe_message(self, symbol: str) -> Union[Dict, str]:
+        """Return the unsubscription message for a symbol (dict or pre-serialized JSON)."""
         pass
     
     @abstractmethod
@@ -247,6 +379,6 @@ class BaseExchange(ABC):
         """Called after successful connection. Override in subclasses if needed."""
         await self.start_ping()
     
-    def get_ping_message(self) -> Optional[Dict]:
-        """Return ping message. Override in subclasses if needed."""
+    def get_ping_message(self) -> Optional[Union[Dict, str]]:
+        """Return ping message (dict or pre-serialized JSON). Override in subclasses if needed."""
         return None
\ No newline at end of file
@@ -34,7 +34,7 @@ class BinanceExchange(BaseExchange):
     
     async def handle_message(self, message: Dict):
         # Add debug logging
-        logger.debug(f"Binance message: {message}")
+        logger.debug("Binance message: %s", message)
         
         # Handle subscription confirmation
         if 'result' in message and message.get('result') is None and 'id' in message:
@@ -50,13 +50,13 @@ class BinanceExchange(BaseExchange):
         
         # Handle price data - Binance sends bookTicker data directly
         if message.get('e') == 'bookTicker':
-            logger.debug(f"Binance price data: {message}")
+            logger.debug("Binance price data: %s", message)
             await self._handle_price_update(message)
         elif 'stream' in message and 'data' in message:
-            logger.debug(f"Binance stream price data: {message['data']}")
+            logger.debug("Binance stream price data: %s", message['data'])
             await self._handle_price_update(message['data'])
         else:
-            logger.debug(f"Binance unknown message format: {message.keys()}")
+            logger.debug("Binance unknown message format: %s", message.keys())
     
     async def _handle_price_update(self, data: Dict):
         """Handle book ticker price updates."""
@@ -70,7 +70,7 @@ class BinanceExchange(BaseExchange):
         timestamp = int(data.get('T', 0))  # Transaction time
         
         price_data = self.format_price_data(symbol, price, bid, ask, timestamp)
-        self.emit('price_update', price_data)
+        self.publish_price_update(price_data)
     
     def get_ping_message(self) -> Optional[Dict]:
         return None  # Binance handles ping/pong automatically
\ No newline at end of file
@@ -44,10 +44,10 @@ class BitgetExchange(BaseExchange):
     
     async def handle_message(self, message):
         if not isinstance(message, dict):
-            logger.debug(f"Bitget non-dict message: {type(message)}")
+            logger.debug("Bitget non-dict message: %s", type(message))
             return
             
-        logger.debug(f"Bitget message: {message}")
+        logger.debug("Bitget message: %s", message)
         
         # Handle subscription confirmation
         if message.get('event') == 'subscribe':
@@ -68,13 +68,13 @@ class BitgetExchange(BaseExchange):
         if 'data' in message:
             arg = message.get('arg', {})
             if isinstance(arg, dict) and arg.get('channel') == 'ticker':
-                logger.debug(f"Bitget ticker data: {message['data']}")
+                logger.debug("Bitget ticker data: %s", message['data'])
                 await self._handle_price_update(message)
             elif isinstance(arg, str) and 'ticker' in arg:
-                logger.debug(f"Bitget ticker data (string format): {message['data']}")
+                logger.debug("Bitget ticker data (string format): %s", message['data'])
                 await self._handle_price_update(message)
         else:
-            logger.debug(f"Bitget unknown message format: {message.keys()}")
+            logger.debug("Bitget unknown message format: %s", message.keys())
     
     async def _handle_price_update(self, message: Dict):
         """Handle ticker price updates."""
@@ -88,7 +88,7 @@ class BitgetExchange(BaseExchange):
                 # Get instrument ID - now uses standard symbol format
                 inst_id = data.get('instId')
                 if not inst_id:
-                    logger.debug(f"Bitget: Missing instId in data: {data.keys()}")
+                    logger.debug("Bitget: Missing instId in data: %s", data.keys())
                     continue
                 
                 symbol = inst_id  # No conversion needed anymore
@@ -100,7 +100,7 @@ class BitgetExchange(BaseExchange):
                 timestamp = data.get('ts', 0)
                 
                 if not all([last_price, bid_price, ask_price]):
-                    logger.debug(f"Bitget {inst_id}: Missing price data - last={last_price}, bid={bid_price}, ask={ask_price}")
+                    logger.debug("Bitget %s: Missing price data - last=%s, bid=%s, ask=%s", inst_id, last_price, bid_price, ask_price)
                     continue
                 
                 # Convert to float with error handling
@@ -110,13 +110,13 @@ class BitgetExchange(BaseExchange):
                 timestamp = int(timestamp)
                 
                 if price <= 0 or bid <= 0 or ask <= 0:
-                    logger.debug(f"Bitget {inst_id}: Invalid price values - price={price}, bid={bid}, ask={ask}")
+                    logger.debug("Bitget %s: Invalid price values - price=%s, bid=%s, ask=%s", inst_id, price, bid, ask)
                     continue
                 
-                logger.debug(f"Bitget {symbol}: price={price}, bid={bid}, ask={ask}")
+                logger.debug("Bitget %s: price=%s, bid=%s, ask=%s", symbol, price, bid, ask)
                 price_data = self.format_price_data(symbol, price, bid, ask, timestamp)
-                logger.debug(f"Bitget emitting price update for {symbol}: {price_data}")
-                self.emit('price_update', price_data)
+                logger.debug("Bitget emitting price update for %s: %s", symbol, price_data)
+                self.publish_price_update(price_data)
                 
             except (ValueError, TypeError) as e:
                 logger.error(f"Error processing Bitget price data: {e}, data: {data}")
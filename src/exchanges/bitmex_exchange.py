@@ -33,7 +33,7 @@ class BitmexExchange(BaseExchange):
     
     
     async def handle_message(self, message: Dict):
-        logger.debug(f"BitMEX message: {message}")
+        logger.debug("BitMEX message: %s", message)
         
         # Handle subscription confirmation
         if message.get('success') is True and 'subscribe' in message:
@@ -52,14 +52,14 @@ class BitmexExchange(BaseExchange):
         
         # Handle quote data (bid/ask)
         if message.get('table') == 'quote' and 'data' in message:
-            logger.debug(f"BitMEX quote data: {message['data']}")
+            logger.debug("BitMEX quote data: %s", message['data'])
             await self._handle_quote_update(message)
         # Handle trade data (last price)
         elif message.get('table') == 'trade' and 'data' in message:
-            logger.debug(f"BitMEX trade data: {message['data']}")
+            logger.debug("BitMEX trade data: %s", message['data'])
             await self._handle_trade_update(message)
         else:
-            logger.debug(f"BitMEX unknown message format: {message.keys()}")
+            logger.debug("BitMEX unknown message format: %s", message.keys())
     
     async def _handle_quote_update(self, message: Dict):
         """Handle quote (bid/ask) price updates."""
@@ -93,7 +93,7 @@ class BitmexExchange(BaseExchange):
             
             # Use BitMEX symbol directly - mapping will handle display symbol conversion
             price_data = self.format_price_data(bitmex_symbol, price, bid, ask, timestamp)
-            self.emit('price_update', price_data)
+            self.publish_price_update(price_data)
     
     async def _handle_trade_update(self, message: Dict):
         """Handle trade (last price) updates."""
@@ -110,7 +110,7 @@ class BitmexExchange(BaseExchange):
             price = data.get('price')
             if price:
                 self.last_prices[bitmex_symbol] = price
-                logger.debug(f"BitMEX {bitmex_symbol}: Updated last price to {price}")
+                logger.debug("BitMEX %s: Updated last price to %s", bitmex_symbol, price)
     
     def _parse_timestamp(self, timestamp_str: str) -> int:
         """Parse BitMEX timestamp string to milliseconds."""
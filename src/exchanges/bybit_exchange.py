@@ -71,7 +71,7 @@ class BybitExchange(BaseExchange):
         timestamp = int(message.get('ts', 0))
         
         price_data = self.format_price_data(symbol, price, bid, ask, timestamp)
-        self.emit('price_update', price_data)
+        self.publish_price_update(price_data)
     
     def get_ping_message(self) -> Optional[Dict]:
         message = {
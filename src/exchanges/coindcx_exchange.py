@@ -157,8 +157,8 @@ class CoindcxExchange(BaseExchange):
                             self.last_prices[cache_key] = price
                             
                             price_data = self.format_price_data(symbol, price, bid, ask, timestamp)
-                            logger.debug(f"CoinDCX price update for {symbol}: ${price:.6f}")
-                            self.emit('price_update', price_data)
+                            logger.debug("CoinDCX price update for %s: $%.6f", symbol, price)
+                            self.publish_price_update(price_data)
                             
                 except (ValueError, TypeError) as e:
                     logger.debug(f"Error parsing CoinDCX price data for {market}: {e}")
@@ -173,15 +173,14 @@ class CoindcxExchange(BaseExchange):
     async def subscribe(self, symbol: str):
         """Subscribe to a symbol."""
         logger.info(f"Subscribing to {symbol} on CoinDCX (REST polling)")
-        self.subscribed_symbols.add(symbol)
+        self._add_subscription(symbol)
         self.target_symbols.add(symbol)
     
     async def unsubscribe(self, symbol: str):
         """Unsubscribe from a symbol."""
         logger.info(f"Unsubscribing from {symbol} on CoinDCX")
         
-        if symbol in self.subscribed_symbols:
-            self.subscribed_symbols.remove(symbol)
+        self._remove_subscription(symbol)
         if symbol in self.target_symbols:
             self.target_symbols.remove(symbol)
     
@@ -200,7 +199,7 @@ class CoindcxExchange(BaseExchange):
         
         self.polling_task = None
         self.is_connected = False
-        self.subscribed_symbols.clear()
+        self._clear_subscriptions()
         self.target_symbols.clear()
         logger.info(f"Disconnected from {self.name}")
     
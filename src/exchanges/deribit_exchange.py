@@ -41,7 +41,7 @@ class DeribitExchange(BaseExchange):
     
     async def handle_message(self, message: Dict):
         # Add debug logging
-        logger.debug(f"Deribit message: {message}")
+        logger.debug("Deribit message: %s", message)
         
         # Handle subscription confirmation
         if 'result' in message and message.get('id'):
@@ -55,10 +55,10 @@ class DeribitExchange(BaseExchange):
         
         # Handle price data notifications
         if 'method' in message and message['method'] == 'subscription':
-            logger.debug(f"Deribit price data: {message['params']}")
+            logger.debug("Deribit price data: %s", message['params'])
             await self._handle_price_update(message)
         else:
-            logger.debug(f"Deribit unknown message format: {message.keys()}")
+            logger.debug("Deribit unknown message format: %s", message.keys())
     
     async def _handle_price_update(self, message: Dict):
         """Handle ticker price updates."""
@@ -76,7 +76,7 @@ class DeribitExchange(BaseExchange):
             # Get instrument name and convert to standard symbol
             instrument_name = data.get('instrument_name')
             if not instrument_name:
-                logger.debug(f"Deribit: Missing instrument_name in data: {data.keys()}")
+                logger.debug("Deribit: Missing instrument_name in data: %s", data.keys())
                 return
             
             # Use Deribit symbol directly - mapping will handle display symbol conversion
@@ -89,7 +89,7 @@ class DeribitExchange(BaseExchange):
             timestamp = data.get('timestamp', 0)
             
             if not all([last_price, best_bid_price, best_ask_price]):
-                logger.debug(f"Deribit {instrument_name}: Missing price data - last={last_price}, bid={best_bid_price}, ask={best_ask_price}")
+                logger.debug("Deribit %s: Missing price data - last=%s, bid=%s, ask=%s", instrument_name, last_price, best_bid_price, best_ask_price)
                 return
             
             # Convert to float with error handling
@@ -99,11 +99,11 @@ class DeribitExchange(BaseExchange):
             timestamp = int(timestamp)
             
             if price <= 0 or bid <= 0 or ask <= 0:
-                logger.debug(f"Deribit {instrument_name}: Invalid price values - price={price}, bid={bid}, ask={ask}")
+                logger.debug("Deribit %s: Invalid price values - price=%s, bid=%s, ask=%s", instrument_name, price, bid, ask)
                 return
             
             price_data = self.format_price_data(symbol, price, bid, ask, timestamp)
-            self.emit('price_update', price_data)
+            self.publish_price_update(price_data)
             
         except (ValueError, TypeError) as e:
             logger.error(f"Error processing Deribit price data: {e}, data: {data}")
@@ -1,14 +1,20 @@
 import logging
 import json
-from typing import Dict, Optional, Set
+from typing import Dict, List, Optional, Set
 from .base_exchange import BaseExchange
 
 logger = logging.getLogger(__name__)
 
+# dYdX market data has no bid/ask, so both are estimated as a 0.1% spread around the oracle price
+_BID_MULT = 0.999
+_ASK_MULT = 1.001
+
 class DydxExchange(BaseExchange):
     def __init__(self):
         super().__init__('dydx')
         self.subscribed_markets: Set[str] = set()
+        # Serialized subscribe messages by symbol, reused when resubscribing after reconnects
+        self._sub_cache: Dict[str, str] = {}
     
     def get_websocket_url(self) -> str:
         return 'wss://indexer.dydx.trade/v4/ws'
@@ -35,7 +41,7 @@ class DydxExchange(BaseExchange):
     
     async def handle_message(self, message: Dict):
         """Handle WebSocket messages from dYdX."""
-        logger.debug(f"dYdX message: {message}")
+        logger.debug("dYdX message: %s", message)
         
         # Handle subscription confirmation
         if message.get('type') == 'subscribed':
@@ -55,7 +61,7 @@ class DydxExchange(BaseExchange):
             if channel == 'v4_markets':
                 await self._handle_market_data(message)
         else:
-            logger.debug(f"dYdX unknown message type: {message.get('type')}")
+            logger.debug("dYdX unknown message type: %s", message.get('type'))
     
     async def _handle_market_data(self, message: Dict):
         """Handle market data from v4_markets channel."""
@@ -67,12 +73,13 @@ class DydxExchange(BaseExchange):
                 return
             
             # Process each market's data
+            subscribed_symbols = self.subscribed_symbols
             for dydx_market_id, market_data in markets.items():
                 # Convert dYdX market ID to standard symbol
                 symbol = self._convert_symbol_from_dydx(dydx_market_id)
                 
                 # Check if we're tracking this symbol
-                if symbol not in self.subscribed_symbols:
+                if symbol not in subscribed_symbols:
                     continue
                 
                 try:
@@ -86,21 +93,19 @@ class DydxExchange(BaseExchange):
                         continue
                     
                     # dYdX doesn't provide bid/ask in market data, estimate from oracle price
-                    spread_percent = 0.001  # 0.1% spread estimate
-                    spread = price * spread_percent
-                    bid = price - spread
-                    ask = price + spread
+                    bid = price * _BID_MULT
+                    ask = price * _ASK_MULT
                     
                     # Use current timestamp since dYdX market data doesn't include timestamp
                     import time
                     timestamp = int(time.time() * 1000)
                     
                     price_data = self.format_price_data(symbol, price, bid, ask, timestamp)
-                    logger.debug(f"dYdX price update for {symbol}: ${price:.6f}")
-                    self.emit('price_update', price_data)
+                    logger.debug("dYdX price update for %s: $%.6f", symbol, price)
+                    self.publish_price_update(price_data)
                     
                 except (ValueError, TypeError) as e:
-                    logger.debug(f"Error parsing dYdX market data for {dydx_market_id}: {e}")
+                    logger.debug("Error parsing dYdX market data for %s: %s", dydx_market_id, e)
                     
         except Exception as e:
             logger.error(f"Error handling dYdX market data: {e}")
@@ -139,14 +144,32 @@ class DydxExchange(BaseExchange):
         dydx_symbol = self._convert_symbol_to_dydx(symbol)
         
         # Add to subscribed symbols
-        self.subscribed_symbols.add(symbol)
+        self._add_subscription(symbol)
         self.subscribed_markets.add(dydx_symbol)
         
         # Send subscription message
-        subscribe_msg = self.get_subscribe_message(symbol)
-        if self.ws and not self.ws.closed:
-            await self.ws.send(json.dumps(subscribe_msg))
-            logger.debug(f"Sent dYdX subscription: {subscribe_msg}")
+        if self._ws_open:
+            subscribe_msg = self._get_cached_subscribe_message(symbol)
+            await self.ws.send(subscribe_msg)
+            logger.debug("Sent dYdX subscription: %s", subscribe_msg)
+    
+    async def subscribe_many(self, symbols: List[str]):
+        """Subscribe to all symbols, pipelining the sends in rate-limited chunks."""
+        logger.info(f"Subscribing to {len(symbols)} symbols on dYdX")
+        
+        for symbol in symbols:
+            self._add_subscription(symbol)
+            self.subscribed_markets.add(self._convert_symbol_to_dydx(symbol))
+        
+        if self._ws_open:
+            await self.send_in_chunks([self._get_cached_subscribe_message(symbol) for symbol in symbols], self.ws.send)
+    
+    def _get_cached_subscribe_message(self, symbol: str) -> str:
+        """Return the serialized subscribe message for a symbol, building it on first use."""
+        subscribe_msg = self._sub_cache.get(symbol)
+        if subscribe_msg is None:
+            subscribe_msg = self._sub_cache[symbol] = json.dumps(self.get_subscribe_message(symbol))
+        return subscribe_msg
     
     async def unsubscribe(self, symbol: str):
         """Unsubscribe from a symbol."""
@@ -154,16 +177,15 @@ class DydxExchange(BaseExchange):
         
         dydx_symbol = self._convert_symbol_to_dydx(symbol)
         
-        if symbol in self.subscribed_symbols:
-            self.subscribed_symbols.remove(symbol)
+        self._remove_subscription(symbol)
         if dydx_symbol in self.subscribed_markets:
             self.subscribed_markets.remove(dydx_symbol)
         
         # Send unsubscription message
         unsubscribe_msg = self.get_unsubscribe_message(symbol)
-        if self.ws and not self.ws.closed:
+        if self._ws_open:
             await self.ws.send(json.dumps(unsubscribe_msg))
-            logger.debug(f"Sent dYdX unsubscription: {unsubscribe_msg}")
+            logger.debug("Sent dYdX unsubscription: %s", unsubscribe_msg)
     
     def get_ping_message(self) -> Optional[Dict]:
         """dYdX WebSocket ping message."""
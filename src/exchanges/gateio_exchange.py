@@ -1,63 +1,102 @@
 import logging
-from typing import Dict, Optional
+import time
+from typing import Dict, List, Optional, Tuple
+
+import orjson
+
 from .base_exchange import BaseExchange
 
 logger = logging.getLogger(__name__)
 
+# Control messages are rendered once with a fixed-width, space-padded 'time' slot
+# right after this prefix, then only that slot is patched for each send
+_TIME_PREFIX = b'{"time":'
+_TIME_OFFSET = len(_TIME_PREFIX)
+_TIME_WIDTH = 10
+# Request ids wrap back to 1 below this bound so the slot never widens and resizes the template
+_TIME_MODULUS = 10 ** _TIME_WIDTH
+
+# First character of a JSON array frame, for text and binary frames
+_LIST_FRAME_START = ('[', b'[')
+
+# Half of the 0.01% synthetic spread, taken on the last price and placed around the mark price
+_HALF_SPREAD = 0.00005
+
 class GateioExchange(BaseExchange):
     def __init__(self):
         super().__init__('gateio')
         self.req_id = 1
+        self._message_templates: Dict[Tuple[str, str, Optional[Tuple[str, ...]]], bytearray] = {}
     
     def get_websocket_url(self) -> str:
         return 'wss://fx-ws.gateio.ws/v4/ws/usdt'
     
-    def get_subscribe_message(self, symbol: str) -> Dict:
+    def get_subscribe_message(self, symbol: str) -> str:
         # Symbol is already in Gate.io format from configuration
-        message = {
-            'time': self.req_id,
-            'channel': 'futures.tickers',
-            'event': 'subscribe',
-            'payload': [symbol]
-        }
-        self.req_id += 1
-        return message
-    
-    def get_unsubscribe_message(self, symbol: str) -> Dict:
+        return self._render_message('futures.tickers', 'subscribe', [symbol])
+    
+    def get_unsubscribe_message(self, symbol: str) -> str:
         # Symbol is already in Gate.io format from configuration
-        message = {
-            'time': self.req_id,
-            'channel': 'futures.tickers',
-            'event': 'unsubscribe',
-            'payload': [symbol]
-        }
-        self.req_id += 1
-        return message
+        return self._render_message('futures.tickers', 'unsubscribe', [symbol])
+    
+    async def subscribe_many(self, symbols: List[str]):
+        """Subscribe to all symbols with a single futures.tickers frame."""
+        if not symbols:
+            return
+        if not self.is_connected:
+            raise ConnectionError(f"Not connected to {self.name}")
+        
+        for symbol in symbols:
+            self._add_subscription(symbol)
+        
+        await self.send_message(self._render_message('futures.tickers', 'subscribe', list(symbols)))
+        logger.info(f"Subscribed to {len(symbols)} symbols on {self.name}")
     
+    def _render_message(self, channel: str, event: str, payload: Optional[List[str]] = None) -> str:
+        """Render a control message from its cached template, patching in the next request id."""
+        key = (channel, event, tuple(payload) if payload else None)
+        template = self._message_templates.get(key)
+        if template is None:
+            body = {'channel': channel, 'event': event}
+            if payload:
+                body['payload'] = payload
+            # '{"channel":...}' -> '{"time":<slot>,"channel":...}'
+            template = bytearray(_TIME_PREFIX + b' ' * _TIME_WIDTH + b',' + orjson.dumps(body)[1:])
+            self._message_templates[key] = template
+        
+        template[_TIME_OFFSET:_TIME_OFFSET + _TIME_WIDTH] = b'%*d' % (_TIME_WIDTH, self.req_id)
+        self.req_id = self.req_id % (_TIME_MODULUS - 1) + 1
+        return template.decode('utf-8')
+    
+    def select_handler(self, raw):
+        """Pick the handler from the frame's first byte so decoded messages skip the list/dict type checks."""
+        if raw[:1] in _LIST_FRAME_START:
+            return self._handle_list_message
+        return self._handle_dict_message
     
     async def handle_message(self, message):
         # Gate.io can send both dict and list messages
         if isinstance(message, list):
-            logger.debug(f"Gate.io list message: {message[:2] if len(message) > 2 else message}")
-            # Handle list messages - these are often heartbeat or subscription confirmations
-            if len(message) >= 1:
-                if message[0] == 'pong':
-                    logger.debug("Gate.io pong received")
-                elif len(message) >= 3 and message[0] == 'futures.tickers' and message[1] == 'update':
-                    # This is ticker data in list format
-                    await self._handle_list_price_update(message)
-            return
-        
-        if not isinstance(message, dict):
-            if isinstance(message, list):
-                logger.debug(f"Gate.io list message: {message}")
+            await self._handle_list_message(message)
+        elif isinstance(message, dict):
+            await self._handle_dict_message(message)
+        else:
+            logger.debug("Gate.io unknown message type: %s", type(message))
+    
+    async def _handle_list_message(self, message: list):
+        """Handle list messages - these are often heartbeat or subscription confirmations."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Gate.io list message: %s", message[:2])
+        if len(message) >= 1:
+            if message[0] == 'pong':
+                logger.debug("Gate.io pong received")
+            elif len(message) >= 3 and message[0] == 'futures.tickers' and message[1] == 'update':
+                # This is ticker data in list format
                 await self._handle_list_price_update(message)
-                return
-            else:
-                logger.debug(f"Gate.io unknown message type: {type(message)}")
-                return
-            
-        logger.debug(f"Gate.io message: {message}")
+    
+    async def _handle_dict_message(self, message: Dict):
+        """Handle dict messages - subscription results, pongs, errors and ticker updates."""
+        logger.debug("Gate.io message: %s", message)
         
         # Handle subscription confirmation
         if message.get('event') == 'subscribe' and message.get('result', {}).get('status') == 'success':
@@ -76,10 +115,10 @@ class GateioExchange(BaseExchange):
         
         # Handle ticker data updates
         if message.get('channel') == 'futures.tickers' and message.get('event') == 'update':
-            logger.debug(f"Gate.io ticker data: {message.get('result')}")
+            logger.debug("Gate.io ticker data: %s", message.get('result'))
             await self._handle_price_update(message)
         else:
-            logger.debug(f"Gate.io unknown message format: {message.keys()}")
+            logger.debug("Gate.io unknown message format: %s", message.keys())
     
     async def _handle_price_update(self, message: Dict):
         """Handle ticker price updates."""
@@ -112,7 +151,7 @@ class GateioExchange(BaseExchange):
         # Get symbol and convert to standard format
         contract = data.get('contract')
         if not contract:
-            logger.debug(f"Gate.io ticker data missing contract: {data.keys()}")
+            logger.debug("Gate.io ticker data missing contract: %s", data.keys())
             return
         
         # Use Gate.io symbol directly - mapping will handle display symbol conversion
@@ -123,7 +162,7 @@ class GateioExchange(BaseExchange):
         mark_price = data.get('mark_price')
         
         if not last_price:
-            logger.debug(f"Gate.io {contract}: Missing price data - last={last_price}")
+            logger.debug("Gate.io %s: Missing price data - last=%s", contract, last_price)
             return
         
         try:
@@ -132,56 +171,58 @@ class GateioExchange(BaseExchange):
             mark = float(mark_price) if mark_price else price
             
             # Create small spread around mark price for bid/ask
-            spread = price * 0.0001  # 0.01% spread
-            bid = mark - spread/2
-            ask = mark + spread/2
+            half_spread = price * _HALF_SPREAD
+            bid = mark - half_spread
+            ask = mark + half_spread
             
             # Improved timestamp parsing
             timestamp = self._parse_gateio_timestamp(data)
             
-            logger.debug(f"Gate.io {symbol}: price={price}, bid={bid}, ask={ask}")
+            logger.debug("Gate.io %s: price=%s, bid=%s, ask=%s", symbol, price, bid, ask)
             price_data = self.format_price_data(symbol, price, bid, ask, timestamp)
-            logger.debug(f"Gate.io emitting price update for {symbol}: {price_data}")
-            self.emit('price_update', price_data)
+            logger.debug("Gate.io emitting price update for %s: %s", symbol, price_data)
+            self.publish_price_update(price_data)
             
         except (ValueError, TypeError) as e:
             logger.error(f"Error processing Gate.io price data for {contract}: {e}")
     
     def _parse_gateio_timestamp(self, data: Dict) -> int:
         """Parse Gate.io timestamp fields."""
-        # Try different timestamp fields Gate.io might use
-        timestamp_fields = ['change_utc', 'timestamp', 'time']
+        # Common case: an integer 'time' field in seconds or milliseconds
+        timestamp = data.get('time')
+        if type(timestamp) is int and timestamp:
+            # If it looks like seconds (Unix timestamp), convert to milliseconds
+            return timestamp * 1000 if timestamp < 1_000_000_000_000 else timestamp
         
-        for field in timestamp_fields:
+        return self._parse_gateio_timestamp_fields(data)
+    
+    def _parse_gateio_timestamp_fields(self, data: Dict) -> int:
+        """Slow path: try every timestamp field Gate.io might use, in any supported type."""
+        for field in ('change_utc', 'timestamp', 'time'):
             timestamp_value = data.get(field)
-            if timestamp_value:
-                try:
-                    # If it's already in milliseconds, use as is
-                    if isinstance(timestamp_value, (int, float)):
-                        timestamp = int(timestamp_value)
-                        # If it looks like seconds (Unix timestamp), convert to milliseconds
-                        if timestamp < 1e12:  # Less than year 33658 in milliseconds
-                            timestamp *= 1000
-                        return timestamp
-                    # If it's a string, try to parse it
-                    elif isinstance(timestamp_value, str):
-                        timestamp = int(float(timestamp_value)) * 1000
-                        return timestamp
-                except (ValueError, TypeError):
-                    continue
+            if not timestamp_value:
+                continue
+            
+            value_type = type(timestamp_value)
+            try:
+                # If it's already in milliseconds, use as is
+                if value_type is int or value_type is float:
+                    timestamp = int(timestamp_value)
+                    # If it looks like seconds (Unix timestamp), convert to milliseconds
+                    if timestamp < 1_000_000_000_000:
+                        timestamp *= 1000
+                    return timestamp
+                # If it's a string, try to parse it
+                elif value_type is str:
+                    return int(float(timestamp_value)) * 1000
+            except (ValueError, TypeError):
+                continue
         
         # Fallback to current time if no timestamp found
-        import time
         return int(time.time() * 1000)
     
-    def get_ping_message(self) -> Optional[Dict]:
-        message = {
-            'time': self.req_id,
-            'channel': 'futures.ping',
-            'event': 'ping'
-        }
-        self.req_id += 1
-        return message
+    def get_ping_message(self) -> Optional[str]:
+        return self._render_message('futures.ping', 'ping')
     
     def normalize_symbol(self, symbol: str) -> str:
         """Normalize symbol format - keep Gate.io format for output."""
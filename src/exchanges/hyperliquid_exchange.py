@@ -1,10 +1,21 @@
 import logging
 import json
-from typing import Dict, Optional
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
 from .base_exchange import BaseExchange
 
 logger = logging.getLogger(__name__)
 
+# Below this many tracked mids per frame, NumPy setup costs more than the math it saves
+_VECTORIZE_MIN_SYMBOLS = 8
+
+# Hyperliquid only provides mid prices, so bid/ask are estimated as a 0.1% spread around the mid
+_BID_MULT = 0.999
+_ASK_MULT = 1.001
+
 class HyperliquidExchange(BaseExchange):
     def __init__(self):
         super().__init__('hyperliquid')
@@ -39,7 +50,7 @@ class HyperliquidExchange(BaseExchange):
     
     async def handle_message(self, message: Dict):
         """Handle WebSocket messages from Hyperliquid."""
-        logger.debug(f"Hyperliquid message: {message}")
+        logger.debug("Hyperliquid message: %s", message)
         
         # Handle subscription confirmation
         if 'channel' in message and message.get('channel') == 'subscriptions':
@@ -50,7 +61,7 @@ class HyperliquidExchange(BaseExchange):
         if 'channel' in message and message.get('channel') == 'allMids':
             await self._handle_price_update(message)
         else:
-            logger.debug(f"Hyperliquid unknown message format: {message}")
+            logger.debug("Hyperliquid unknown message format: %s", message)
     
     async def _handle_price_update(self, message: Dict):
         """Handle price updates from AllMids channel."""
@@ -61,7 +72,9 @@ class HyperliquidExchange(BaseExchange):
             if not mids:
                 return
             
-            # Process each symbol's mid price
+            # Collect the tracked symbols' mid prices before doing any price math
+            subscribed_symbols = self.subscribed_symbols
+            subs = []
             for hyperliquid_symbol, mid_price_str in mids.items():
                 if not mid_price_str:
                     continue
@@ -70,34 +83,67 @@ class HyperliquidExchange(BaseExchange):
                 symbol = self._convert_symbol_from_hyperliquid(hyperliquid_symbol)
                 
                 # Check if we're tracking this symbol
-                if symbol not in self.subscribed_symbols:
-                    continue
-                
+                if symbol in subscribed_symbols:
+                    subs.append((symbol, mid_price_str))
+            
+            if not subs:
+                return
+            
+            # Use current timestamp since Hyperliquid doesn't provide timestamp in AllMids
+            timestamp = int(time.time() * 1000)
+            
+            # Vectorize the bid/ask estimate for large frames; small ones stay scalar
+            # to avoid the NumPy setup overhead
+            if len(subs) > _VECTORIZE_MIN_SYMBOLS:
                 try:
-                    mid_price = float(mid_price_str)
+                    prices = np.fromiter((mid for _, mid in subs), dtype=np.float64, count=len(subs))
+                except (ValueError, TypeError):
+                    # A malformed mid poisons the whole batch, let the scalar path skip it
+                    self._emit_mid_prices(subs, timestamp)
+                    return
+                
+                bids = prices * _BID_MULT
+                asks = prices * _ASK_MULT
+                
+                # Bound once, the loop body runs for every tracked symbol in the frame
+                format_price_data = self.format_price_data
+                publish_price_update = self.publish_price_update
+                debug = logger.debug
+                for (symbol, _), mid_price, bid, ask in zip(subs, prices.tolist(), bids.tolist(), asks.tolist()):
                     if mid_price <= 0:
                         continue
                     
-                    # Hyperliquid provides mid price, estimate bid/ask
-                    spread_percent = 0.001  # 0.1% spread estimate
-                    spread = mid_price * spread_percent
-                    bid = mid_price - spread
-                    ask = mid_price + spread
-                    
-                    # Use current timestamp since Hyperliquid doesn't provide timestamp in AllMids
-                    import time
-                    timestamp = int(time.time() * 1000)
-                    
-                    price_data = self.format_price_data(symbol, mid_price, bid, ask, timestamp)
-                    logger.debug(f"Hyperliquid price update for {symbol}: ${mid_price:.6f}")
-                    self.emit('price_update', price_data)
-                    
-                except (ValueError, TypeError) as e:
-                    logger.debug(f"Error parsing Hyperliquid price for {hyperliquid_symbol}: {e}")
+                    price_data = format_price_data(symbol, mid_price, bid, ask, timestamp)
+                    debug("Hyperliquid price update for %s: $%.6f", symbol, mid_price)
+                    publish_price_update(price_data)
+            else:
+                self._emit_mid_prices(subs, timestamp)
                     
         except Exception as e:
             logger.error(f"Error handling Hyperliquid price update: {e}")
     
+    def _emit_mid_prices(self, subs: List[Tuple[str, str]], timestamp: int):
+        """Emit price updates for (symbol, mid price string) pairs one at a time."""
+        format_price_data = self.format_price_data
+        publish_price_update = self.publish_price_update
+        debug = logger.debug
+        for symbol, mid_price_str in subs:
+            try:
+                mid_price = float(mid_price_str)
+                if mid_price <= 0:
+                    continue
+                
+                # Hyperliquid provides mid price, estimate bid/ask
+                bid = mid_price * _BID_MULT
+                ask = mid_price * _ASK_MULT
+                
+                price_data = format_price_data(symbol, mid_price, bid, ask, timestamp)
+                debug("Hyperliquid price update for %s: $%.6f", symbol, mid_price)
+                publish_price_update(price_data)
+                
+            except (ValueError, TypeError) as e:
+                debug("Error parsing Hyperliquid price for %s: %s", symbol, e)
+    
     def _convert_symbol_from_hyperliquid(self, hyperliquid_symbol: str) -> str:
         """Convert Hyperliquid symbol format to standard format.
         
@@ -126,29 +172,43 @@ class HyperliquidExchange(BaseExchange):
         logger.info(f"Subscribing to {symbol} on Hyperliquid")
         
         # Add to subscribed symbols
-        self.subscribed_symbols.add(symbol)
+        self._add_subscription(symbol)
         
         # For Hyperliquid, we subscribe to AllMids once and filter symbols locally
         # Only send subscription if this is the first symbol
         if len(self.subscribed_symbols) == 1:
             subscribe_msg = self.get_subscribe_message(symbol)
-            if self.ws and not self.ws.closed:
+            if self._ws_open:
+                await self.ws.send(json.dumps(subscribe_msg))
+                logger.debug("Sent Hyperliquid subscription: %s", subscribe_msg)
+    
+    async def subscribe_many(self, symbols: List[str]):
+        """Subscribe to several symbols, sending the single AllMids subscription if needed."""
+        logger.info(f"Subscribing to {len(symbols)} symbols on Hyperliquid")
+        
+        for symbol in symbols:
+            self._add_subscription(symbol)
+        
+        # AllMids covers every symbol. Send it whenever there is an open socket: on reconnect the
+        # symbols are already tracked, but the new socket has no subscription yet
+        if symbols:
+            subscribe_msg = self.get_subscribe_message(symbols[0])
+            if self._ws_open:
                 await self.ws.send(json.dumps(subscribe_msg))
-                logger.debug(f"Sent Hyperliquid subscription: {subscribe_msg}")
+                logger.debug("Sent Hyperliquid subscription: %s", subscribe_msg)
     
     async def unsubscribe(self, symbol: str):
         """Unsubscribe from a symbol."""
         logger.info(f"Unsubscribing from {symbol} on Hyperliquid")
         
-        if symbol in self.subscribed_symbols:
-            self.subscribed_symbols.remove(symbol)
+        self._remove_subscription(symbol)
         
         # If no symbols left, unsubscribe from AllMids
         if len(self.subscribed_symbols) == 0:
             unsubscribe_msg = self.get_unsubscribe_message(symbol)
-            if self.ws and not self.ws.closed:
+            if self._ws_open:
                 await self.ws.send(json.dumps(unsubscribe_msg))
-                logger.debug(f"Sent Hyperliquid unsubscription: {unsubscribe_msg}")
+                logger.debug("Sent Hyperliquid unsubscription: %s", unsubscribe_msg)
     
     def get_ping_message(self) -> Optional[Dict]:
         """Hyperliquid WebSocket ping message."""
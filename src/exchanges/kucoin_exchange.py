@@ -1,26 +1,69 @@
-import logging
 import asyncio
-import json
-import urllib.request
-import urllib.parse
-from typing import Dict, Optional
-from .base_exchange import BaseExchange
+import itertools
+import logging
+from typing import Dict, List, Optional
+
+import aiohttp
+import orjson
+
+from .base_exchange import ID_PLACEHOLDER, BaseExchange
 
 logger = logging.getLogger(__name__)
 
+KUCOIN_TOKEN_URL = 'https://api.kucoin.com/api/v1/bullet-public'
+
+# Ping frames differ only in their request id
+_PING_TEMPLATE = '{"id":%d,"type":"ping"}'
+
+# Ticker topics look like '/contractMarket/ticker:XBTUSDTM'
+_TOPIC_PREFIX = '/contractMarket/ticker:'
+_TOPIC_PREFIX_LEN = len(_TOPIC_PREFIX)
+
+# Token requests are small; fail fast on slow connects or stalled reads
+_TOKEN_TIMEOUT = aiohttp.ClientTimeout(total=10, sock_connect=3, sock_read=5)
+# Network failures are retried with exponential backoff (1s, 2s, ...)
+_TOKEN_ATTEMPTS = 3
+
+# Shared across reconnects so token requests reuse pooled keep-alive connections
+_kucoin_session: Optional[aiohttp.ClientSession] = None
+
+
+def _get_session() -> aiohttp.ClientSession:
+    """Return the shared KuCoin HTTP session, creating it on first use."""
+    global _kucoin_session
+    if _kucoin_session is None or _kucoin_session.closed:
+        connector = aiohttp.TCPConnector(limit=4, ttl_dns_cache=300, keepalive_timeout=60)
+        _kucoin_session = aiohttp.ClientSession(connector=connector, timeout=_TOKEN_TIMEOUT)
+    return _kucoin_session
+
+
+async def _close_session():
+    """Close the shared KuCoin HTTP session if it is open."""
+    global _kucoin_session
+    if _kucoin_session is not None and not _kucoin_session.closed:
+        await _kucoin_session.close()
+    _kucoin_session = None
+
+
 class KucoinExchange(BaseExchange):
     def __init__(self):
         super().__init__('kucoin')
         self.token = None
         self.endpoint = None
-        self.req_id = 1
+        self._ids = itertools.count(1)  # Request ids for subscribe/unsubscribe/ping
+        self._topic_symbols: Dict[str, str] = {}  # ticker topic -> KuCoin symbol
+        # Message type -> handler, so each frame costs one lookup instead of a chain of checks
+        self._dispatch = {
+            'message': self._handle_price_update,
+            'ack': self._on_ack,
+            'welcome': self._on_welcome,
+            'pong': self._on_pong,
+        }
     
     async def get_websocket_token(self):
-        """Get WebSocket token from KuCoin API using urllib."""
+        """Get WebSocket token from KuCoin API."""
         try:
-            # Run the synchronous urllib request in a thread pool
-            loop = asyncio.get_event_loop()
-            data = await loop.run_in_executor(None, self._fetch_token_sync)
+            data = await self._fetch_token()
             
             if data and data.get('code') == '200000':
                 token_data = data['data']
@@ -41,27 +84,27 @@ class KucoinExchange(BaseExchange):
             logger.error(f"Error getting KuCoin WebSocket token: {e}")
             return False
     
-    def _fetch_token_sync(self):
-        """Synchronous token fetch using urllib."""
-        try:
-            # Create POST request for KuCoin token
-            url = 'https://api.kucoin.com/api/v1/bullet-public'
-            data = urllib.parse.urlencode({}).encode('utf-8')
-            
-            request = urllib.request.Request(url, data=data, method='POST')
-            request.add_header('Content-Type', 'application/x-www-form-urlencoded')
-            
-            with urllib.request.urlopen(request, timeout=10) as response:
-                if response.status == 200:
-                    response_data = response.read().decode('utf-8')
-                    return json.loads(response_data)
-                else:
-                    logger.error(f"Failed to get KuCoin token. Status: {response.status}")
-                    return None
-                    
-        except Exception as e:
-            logger.error(f"HTTP error getting KuCoin token: {e}")
-            return None
+    async def _fetch_token(self):
+        """Fetch a public WebSocket token over the shared HTTP session, retrying network errors."""
+        for attempt in range(1, _TOKEN_ATTEMPTS + 1):
+            try:
+                async with _get_session().post(KUCOIN_TOKEN_URL) as response:
+                    if response.status == 200:
+                        return orjson.loads(await response.read())
+                    else:
+                        logger.error(f"Failed to get KuCoin token. Status: {response.status}")
+                        return None
+                        
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning(f"HTTP error getting KuCoin token (attempt {attempt}/{_TOKEN_ATTEMPTS}): {e}")
+                if attempt < _TOKEN_ATTEMPTS:
+                    await asyncio.sleep(2 ** (attempt - 1))
+            except Exception as e:
+                logger.error(f"HTTP error getting KuCoin token: {e}")
+                return None
+        
+        logger.error(f"Giving up on KuCoin token after {_TOKEN_ATTEMPTS} attempts")
+        return None
     
     def get_websocket_url(self) -> str:
         if not self.endpoint or not self.token:
@@ -77,90 +120,116 @@ class KucoinExchange(BaseExchange):
         logger.info(f"Connecting to KuCoin WebSocket: {self.get_websocket_url()}")
         return await super().connect()
     
-    def get_subscribe_message(self, symbol: str) -> Dict:
+    async def disconnect(self):
+        """Disconnect and release the pooled HTTP connections used for tokens."""
+        await super().disconnect()
+        await _close_session()
+    
+    def get_subscribe_message(self, symbol: str) -> str:
         # Symbol is already in KuCoin format from configuration
-        message = {
-            'id': self.req_id,
+        topic = _TOPIC_PREFIX + symbol
+        # Register the topic up front so even the first tick resolves its symbol with one lookup
+        self._topic_symbols[topic] = symbol
+        message = self.render_cached_message(('subscribe', symbol), lambda: {
+            'id': ID_PLACEHOLDER,
             'type': 'subscribe',
-            'topic': f'/contractMarket/ticker:{symbol}',
+            'topic': topic,
             'privateChannel': False,
             'response': True
-        }
-        self.req_id += 1
+        }, next(self._ids))
         return message
     
-    def get_unsubscribe_message(self, symbol: str) -> Dict:
+    async def subscribe_many(self, symbols: List[str]):
+        """Subscribe to all symbols, pipelining the sends in rate-limited chunks."""
+        if not symbols:
+            return
+        if not self.is_connected:
+            raise ConnectionError(f"Not connected to {self.name}")
+        
+        for symbol in symbols:
+            self._add_subscription(symbol)
+        
+        # KuCoin allows 100 uplink messages per 10s; the default 10 per 1s chunking stays under it
+        await self.send_in_chunks([self.get_subscribe_message(symbol) for symbol in symbols], self.send_message)
+        logger.info(f"Subscribed to {len(symbols)} symbols on {self.name}")
+    
+    def get_unsubscribe_message(self, symbol: str) -> str:
         # Symbol is already in KuCoin format from configuration
-        message = {
-            'id': self.req_id,
+        message = self.render_cached_message(('unsubscribe', symbol), lambda: {
+            'id': ID_PLACEHOLDER,
             'type': 'unsubscribe',
             'topic': f'/contractMarket/ticker:{symbol}',
             'privateChannel': False,
             'response': True
-        }
-        self.req_id += 1
+        }, next(self._ids))
         return message
     
     async def handle_message(self, message: Dict):
         # Add debug logging
-        logger.debug(f"KuCoin message: {message}")
-        
-        # Handle subscription confirmation
-        if message.get('type') == 'ack':
-            logger.info(f"KuCoin subscription confirmed for request {message.get('id')}")
-            return
-        
-        # Handle welcome message
-        if message.get('type') == 'welcome':
-            logger.info("KuCoin WebSocket connection established")
-            return
+        logger.debug("KuCoin message: %s", message)
         
-        # Handle pong responses
-        if message.get('type') == 'pong':
-            logger.debug('Received pong from KuCoin')
-            return
-        
-        # Handle price data
-        if message.get('type') == 'message' and 'data' in message:
-            logger.debug(f"KuCoin price data: {message['data']}")
-            await self._handle_price_update(message)
+        handler = self._dispatch.get(message.get('type'))
+        if handler is not None:
+            handler(message)
         else:
-            logger.debug(f"KuCoin unknown message format: {message.keys()}")
+            logger.debug("KuCoin unknown message format: %s", message.keys())
+    
+    def _on_ack(self, message: Dict):
+        """Handle subscription confirmation."""
+        logger.info(f"KuCoin subscription confirmed for request {message.get('id')}")
     
-    async def _handle_price_update(self, message: Dict):
+    def _on_welcome(self, message: Dict):
+        """Handle welcome message."""
+        logger.info("KuCoin WebSocket connection established")
+    
+    def _on_pong(self, message: Dict):
+        """Handle pong responses."""
+        logger.debug('Received pong from KuCoin')
+    
+    def _handle_price_update(self, message: Dict):
         """Handle ticker price updates."""
         data = message.get('data')
         if not data:
+            logger.debug("KuCoin unknown message format: %s", message.keys())
             return
         
-        # Extract symbol from topic
+        # Extract symbol from topic, slicing each topic only the first time it is seen
         topic = message.get('topic', '')
-        if not topic.startswith('/contractMarket/ticker:'):
-            return
-        
-        kucoin_symbol = topic.split(':')[1]
-        # Use KuCoin symbol directly - mapping will handle display symbol conversion
-        symbol = kucoin_symbol
+        symbol = self._topic_symbols.get(topic)
+        if symbol is None:
+            if not topic.startswith(_TOPIC_PREFIX):
+                return
+            
+            # Use KuCoin symbol directly - mapping will handle display symbol conversion
+            symbol = self._topic_symbols[topic] = topic[_TOPIC_PREFIX_LEN:]
         
-        # Get price data
-        price = float(data.get('price', 0))
-        bid = float(data.get('bestBidPrice', 0))
-        ask = float(data.get('bestAskPrice', 0))
-        timestamp = int(data.get('ts', 0)) // 1000000  # Convert from nanoseconds to milliseconds
+        # Get price data; ticker pushes always carry these fields, so index directly
+        try:
+            price = float(data['price'])
+            bid = float(data['bestBidPrice'])
+            ask = float(data['bestAskPrice'])
+        except KeyError:
+            return
+        # Convert from nanoseconds to milliseconds; ts normally arrives as an int
+        ts = data.get('ts')
+        timestamp = ts // 1000000 if ts.__class__ is int else self._parse_timestamp(ts)
         
         if price == 0 or bid == 0 or ask == 0:
             return
         
         price_data = self.format_price_data(symbol, price, bid, ask, timestamp)
-        self.emit('price_update', price_data)
+        self.publish_price_update(price_data)
     
-    def get_ping_message(self) -> Optional[Dict]:
-        message = {
-            'id': self.req_id,
-            'type': 'ping'
-        }
-        self.req_id += 1
-        return message
+    @staticmethod
+    def _parse_timestamp(ts) -> int:
+        """Convert a non-int (e.g. string) nanosecond timestamp to milliseconds, 0 if invalid."""
+        try:
+            return int(ts) // 1000000 if ts else 0
+        except (ValueError, TypeError):
+            return 0
+    
+    def get_ping_message(self) -> Optional[str]:
+        return _PING_TEMPLATE % next(self._ids)
     
     def normalize_symbol(self, symbol: str) -> str:
         """Normalize symbol format - keep KuCoin format for output."""
@@ -1,44 +1,62 @@
+import itertools
 import logging
-from typing import Dict, Optional
-from .base_exchange import BaseExchange
+from operator import itemgetter
+from typing import Callable, Dict, Optional
+from .base_exchange import ID_PLACEHOLDER, BaseExchange
 
 logger = logging.getLogger(__name__)
 
+# Heartbeat message, formatted with the request id
+_PING_TEMPLATE = '{"method":"ping","id":%d}'
+
+# Field names MEXC might use for last/bid/ask, preferred name first
+_PRICE_FIELDS = (('lastPrice', 'last'), ('bid1', 'bidPrice'), ('ask1', 'askPrice'))
+
 class MexcExchange(BaseExchange):
     def __init__(self):
         super().__init__('mexc')
-        self.req_id = 1
+        self._ids = itertools.count(1)  # Request ids for subscribe/unsubscribe/ping
+        # Reads (last, bid, ask) with the field names the feed uses; relearned when a field is missing or empty
+        self._price_getter: Callable = itemgetter(*(names[0] for names in _PRICE_FIELDS))
+        # Channel -> handler for pushed messages; responses without a channel fall back to code checks
+        self._dispatch = {
+            'push.ticker': self._handle_price_update,
+            'pong': self._on_pong,
+        }
     
     def get_websocket_url(self) -> str:
         return 'wss://contract.mexc.com/edge'
     
-    def get_subscribe_message(self, symbol: str) -> Dict:
+    def get_subscribe_message(self, symbol: str) -> str:
         # Symbol is already in MEXC format from configuration
-        message = {
+        message = self.render_cached_message(('subscribe', symbol), lambda: {
             'method': 'sub.ticker',
             'param': {
                 'symbol': symbol
             },
-            'id': self.req_id
-        }
-        self.req_id += 1
+            'id': ID_PLACEHOLDER
+        }, next(self._ids))
         return message
     
-    def get_unsubscribe_message(self, symbol: str) -> Dict:
+    def get_unsubscribe_message(self, symbol: str) -> str:
         # Symbol is already in MEXC format from configuration
-        message = {
+        message = self.render_cached_message(('unsubscribe', symbol), lambda: {
             'method': 'unsub.ticker',
             'param': {
                 'symbol': symbol
             },
-            'id': self.req_id
-        }
-        self.req_id += 1
+            'id': ID_PLACEHOLDER
+        }, next(self._ids))
         return message
     
     
     async def handle_message(self, message: Dict):
-        logger.debug(f"MEXC message: {message}")
+        logger.debug("MEXC message: %s", message)
+        
+        handler = self._dispatch.get(message.get('channel'))
+        if handler is not None:
+            handler(message)
+            return
         
         # Handle subscription confirmation
         if message.get('code') == 0 and 'id' in message:
@@ -52,19 +70,13 @@ class MexcExchange(BaseExchange):
             logger.error(f"MEXC error: {error_msg}")
             return
         
-        # Handle pong responses
-        if message.get('channel') == 'pong':
-            logger.debug('Received pong from MEXC')
-            return
-        
-        # Handle ticker data
-        if message.get('channel') == 'push.ticker' and 'data' in message:
-            logger.debug(f"MEXC ticker data: {message['data']}")
-            await self._handle_price_update(message)
-        else:
-            logger.debug(f"MEXC unknown message format: {message.keys()}")
+        logger.debug("MEXC unknown message format: %s", message.keys())
+    
+    def _on_pong(self, message: Dict):
+        """Handle pong responses."""
+        logger.debug('Received pong from MEXC')
     
-    async def _handle_price_update(self, message: Dict):
+    def _handle_price_update(self, message: Dict):
         """Handle ticker price updates."""
         data = message.get('data')
         if not data:
@@ -75,21 +87,27 @@ class MexcExchange(BaseExchange):
             # Get symbol and convert to standard format
             symbol_data = data.get('symbol')
             if not symbol_data:
-                logger.debug(f"MEXC: Missing symbol in data: {data.keys()}")
+                logger.debug("MEXC: Missing symbol in data: %s", data.keys())
                 return
             
             # Use MEXC symbol directly - mapping will handle display symbol conversion
             symbol = symbol_data
             
             # Get price data - MEXC might use different field names
-            last_price = data.get('lastPrice') or data.get('last')
-            bid_price = data.get('bid1') or data.get('bidPrice')
-            ask_price = data.get('ask1') or data.get('askPrice')
-            timestamp = data.get('timestamp', 0)
+            try:
+                last_price, bid_price, ask_price = self._price_getter(data)
+            except KeyError:
+                last_price = bid_price = ask_price = None
             
-            if not all([last_price, bid_price, ask_price]):
-                logger.debug(f"MEXC {symbol_data}: Missing price data - last={last_price}, bid={bid_price}, ask={ask_price}")
-                return
+            if not (last_price and bid_price and ask_price):
+                # A field is missing or empty (e.g. lastPrice: 0); fall back to the alternates that hold values
+                getter = self._learn_price_getter(data)
+                if getter is None:
+                    logger.debug("MEXC %s: Missing price data - fields=%s", symbol_data, data.keys())
+                    return
+                self._price_getter = getter
+                last_price, bid_price, ask_price = getter(data)
+            timestamp = data.get('timestamp', 0)
             
             # Convert to float with error handling
             price = float(last_price)
@@ -98,25 +116,32 @@ class MexcExchange(BaseExchange):
             timestamp = int(timestamp)
             
             if price <= 0 or bid <= 0 or ask <= 0:
-                logger.debug(f"MEXC {symbol_data}: Invalid price values - price={price}, bid={bid}, ask={ask}")
+                logger.debug("MEXC %s: Invalid price values - price=%s, bid=%s, ask=%s", symbol_data, price, bid, ask)
                 return
             
             price_data = self.format_price_data(symbol, price, bid, ask, timestamp)
-            self.emit('price_update', price_data)
+            self.publish_price_update(price_data)
             
         except (ValueError, TypeError) as e:
             logger.error(f"Error processing MEXC price data: {e}, data: {data}")
         except Exception as e:
             logger.error(f"Unexpected error processing MEXC price data: {e}")
     
-    def get_ping_message(self) -> Optional[Dict]:
-        message = {
-            'method': 'ping',
-            'id': self.req_id
-        }
-        self.req_id += 1
-        return message
+    def _learn_price_getter(self, data: Dict) -> Optional[Callable]:
+        """Build a getter for the first non-empty last/bid/ask field in data, or None if one has no value."""
+        keys = []
+        for names in _PRICE_FIELDS:
+            for name in names:
+                if data.get(name):
+                    keys.append(name)
+                    break
+            else:
+                return None
+        return itemgetter(*keys)
+    
+    def get_ping_message(self) -> Optional[str]:
+        return _PING_TEMPLATE % next(self._ids)
     
     def normalize_symbol(self, symbol: str) -> str:
         """Normalize symbol format - keep MEXC format for output."""
-        return symbol.upper()
\ No newline at end of file
+        return symbol.upper()
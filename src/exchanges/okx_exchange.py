@@ -8,61 +8,77 @@ class OKXExchange(BaseExchange):
     def __init__(self):
         super().__init__('okx')
         # OKX doesn't use request IDs in its WebSocket API
+        # Event responses are keyed on 'event', pushed data on its 'arg' channel
+        self._event_handlers = {
+            'subscribe': self._on_subscribe,
+            'error': self._on_error,
+        }
+        self._channel_handlers = {
+            'books': self._handle_price_update,
+        }
     
     def get_websocket_url(self) -> str:
         return 'wss://ws.okx.com:8443/ws/v5/public'
     
-    def get_subscribe_message(self, symbol: str) -> Dict:
+    def get_subscribe_message(self, symbol: str) -> str:
         # Symbol is already in OKX format from configuration
-        return {
+        return self.render_cached_message(('subscribe', symbol), lambda: {
             'op': 'subscribe',
             'args': [{
                 'channel': 'books',
                 'instId': symbol
             }]
-        }
+        })
     
-    def get_unsubscribe_message(self, symbol: str) -> Dict:
+    def get_unsubscribe_message(self, symbol: str) -> str:
         # Symbol is already in OKX format from configuration
-        return {
+        return self.render_cached_message(('unsubscribe', symbol), lambda: {
             'op': 'unsubscribe',
             'args': [{
                 'channel': 'books',
                 'instId': symbol
             }]
-        }
+        })
     
     
     async def handle_message(self, message: Dict):
-        # Handle subscription confirmation
-        if message.get('event') == 'subscribe':
-            inst_id = message.get('arg', {}).get('instId', 'unknown')
-            logger.info(f"OKX subscription confirmed for {inst_id}")
-            return
-        
-        # Handle errors
-        if message.get('event') == 'error':
-            error_msg = message.get('msg', 'Unknown OKX error')
-            logger.error(f"OKX error: {error_msg}")
-            self.emit('error', Exception(error_msg))
+        event = message.get('event')
+        if event is not None:
+            handler = self._event_handlers.get(event)
+            if handler is not None:
+                handler(message)
             return
         
         # Handle price data
-        if message.get('arg') and message.get('data') and message['arg'].get('channel') == 'books':
-            await self._handle_price_update(message)
+        arg = message.get('arg')
+        if arg and message.get('data'):
+            handler = self._channel_handlers.get(arg.get('channel'))
+            if handler is not None:
+                handler(message)
+    
+    def _on_subscribe(self, message: Dict):
+        """Handle subscription confirmation."""
+        inst_id = message.get('arg', {}).get('instId', 'unknown')
+        logger.info(f"OKX subscription confirmed for {inst_id}")
+    
+    def _on_error(self, message: Dict):
+        """Handle error responses."""
+        error_msg = message.get('msg', 'Unknown OKX error')
+        logger.error(f"OKX error: {error_msg}")
+        self.emit('error', Exception(error_msg))
     
-    async def _handle_price_update(self, message: Dict):
+    def _handle_price_update(self, message: Dict):
         """Handle orderbook price updates."""
         data = message.get('data')
-        if not data or len(data) == 0:
+        if not data:
             return
         
         book_data = data[0]
         symbol = message['arg']['instId']
         
         # Get best bid and ask
-        bids = book_data.get('bids', [])
-        asks = book_data.get('asks', [])
+        bids = book_data.get('bids')
+        asks = book_data.get('asks')
         
         if not bids or not asks:
             return
@@ -74,8 +90,8 @@ class OKXExchange(BaseExchange):
         
         # Use OKX symbol directly - mapping will handle display symbol conversion
         price_data = self.format_price_data(symbol, price, bid, ask, timestamp)
-        self.emit('price_update', price_data)
+        self.publish_price_update(price_data)
     
-    def get_ping_message(self) -> Optional[Dict]:
+    def get_ping_message(self) -> Optional[str]:
         # OKX uses simple ping string - convert to proper format
-        return {'op': 'ping'}
\ No newline at end of file
+        return self.render_cached_message('ping', lambda: {'op': 'ping'})
\ No newline at end of file
@@ -1,13 +1,33 @@
+import functools
+import itertools
 import logging
-from typing import Dict, Optional
-from .base_exchange import BaseExchange
+from typing import Dict, List, Optional
+
+from .base_exchange import ID_PLACEHOLDER, BaseExchange
 
 logger = logging.getLogger(__name__)
 
+# server.ping heartbeat; only the request id changes between sends
+_PING_TEMPLATE = '{"id":%d,"method":"server.ping","params":[]}'
+
+def _first_live_level(levels: List) -> Optional[List]:
+    """Return the first [price, size] book level with a positive size, reading levels in place."""
+    for level in levels:
+        if len(level) >= 2 and level[1] > 0:
+            return level
+    return None
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_symbol(symbol: str) -> str:
+    """Normalized output symbol for a Phemex symbol, cached since every tick repeats the same few."""
+    if symbol.startswith('c') and symbol.endswith('USD'):
+        return symbol  # Keep original case for perpetual contracts like cETHUSD
+    return symbol.upper()
+
 class PhemexExchange(BaseExchange):
     def __init__(self):
         super().__init__('phemex')
-        self.req_id = 1
+        self._ids = itertools.count(1)  # Request ids for subscribe/unsubscribe/ping
         # Phemex scale factors for different symbols
         self.scale_factors = {
             'BTCUSD': 10000,  # 4 decimal places
@@ -16,47 +36,47 @@ class PhemexExchange(BaseExchange):
             'XRPUSD': 100000000,  # 8 decimal places
             'ADAUSD': 100000000,  # 8 decimal places
         }
+        # Reciprocal scales so prices are scaled down with a multiply instead of a divide
+        self._inv_scale = {symbol: 1.0 / scale for symbol, scale in self.scale_factors.items()}
+        self._default_inv_scale = 1.0 / 10000  # Default scale is 10000
+        # Book pushes are keyed on 'type'; the old format is keyed on 'method'
+        self._dispatch = {
+            'snapshot': self._handle_direct_orderbook_update,
+            'incremental': self._handle_direct_orderbook_update,
+            'orderbook.update': self._handle_price_update,
+        }
     
     def get_websocket_url(self) -> str:
         return 'wss://ws.phemex.com'
     
-    def get_subscribe_message(self, symbol: str) -> Dict:
+    def get_subscribe_message(self, symbol: str) -> str:
         # Symbol is already in Phemex format from configuration
-        message = {
-            'id': self.req_id,
+        message = self.render_cached_message(('subscribe', symbol), lambda: {
+            'id': ID_PLACEHOLDER,
             'method': 'orderbook.subscribe',
             'params': [symbol, 20]  # Symbol and depth level
-        }
-        self.req_id += 1
+        }, next(self._ids))
         return message
     
-    def get_unsubscribe_message(self, symbol: str) -> Dict:
+    def get_unsubscribe_message(self, symbol: str) -> str:
         # Symbol is already in Phemex format from configuration
-        message = {
-            'id': self.req_id,
+        message = self.render_cached_message(('unsubscribe', symbol), lambda: {
+            'id': ID_PLACEHOLDER,
             'method': 'orderbook.unsubscribe',
             'params': [symbol]
-        }
-        self.req_id += 1
+        }, next(self._ids))
         return message
     
     
-    async def handle_message(self, message):
-        if not isinstance(message, dict):
-            logger.debug(f"Phemex non-dict message: {type(message)} - {str(message)[:100]}")
-            # Handle string messages that might be JSON
-            if isinstance(message, str):
-                try:
-                    import json
-                    parsed_message = json.loads(message)
-                    await self.handle_message(parsed_message)
-                    return
-                except json.JSONDecodeError as e:
-                    logger.debug(f"Failed to parse Phemex string message as JSON: {e}")
-                    return
+    async def handle_message(self, message: Dict):
+        # Frames arrive already decoded to dicts by BaseExchange.decode_message
+        logger.debug("Phemex message: %s", message)
+        
+        # Market data: one lookup picks the handler
+        handler = self._dispatch.get(message.get('type') or message.get('method'))
+        if handler is not None:
+            handler(message)
             return
-            
-        logger.debug(f"Phemex message: {message}")
         
         # Handle subscription confirmation
         result = message.get('result')
@@ -66,10 +86,10 @@ class PhemexExchange(BaseExchange):
                 return
             elif isinstance(result, str):
                 if result == 'pong':
-                    logger.debug(f"Phemex pong response for request {message['id']}")
+                    logger.debug("Phemex pong response for request %s", message['id'])
                     return
                 else:
-                    logger.debug(f"Phemex string result for request {message['id']}: {result}")
+                    logger.debug("Phemex string result for request %s: %s", message['id'], result)
                     return
         
         # Handle error responses
@@ -77,18 +97,14 @@ class PhemexExchange(BaseExchange):
             logger.error(f"Phemex error: {message['error']}")
             return
         
-        # Handle orderbook data updates (new format)
+        # Handle orderbook data updates that arrive without a type
         if 'book' in message and 'symbol' in message:
-            logger.debug(f"Phemex orderbook data: symbol={message['symbol']}, book={message['book']}")
-            await self._handle_direct_orderbook_update(message)
-        # Handle orderbook data updates (old format - keeping for compatibility)
-        elif message.get('method') == 'orderbook.update' and 'params' in message:
-            logger.debug(f"Phemex orderbook data: {message['params']}")
-            await self._handle_price_update(message)
+            logger.debug("Phemex orderbook data: symbol=%s, book=%s", message['symbol'], message['book'])
+            self._handle_direct_orderbook_update(message)
         else:
-            logger.debug(f"Phemex unknown message format: {message.keys()}")
+            logger.debug("Phemex unknown message format: %s", message.keys())
     
-    async def _handle_direct_orderbook_update(self, message: Dict):
+    def _handle_direct_orderbook_update(self, message: Dict):
         """Handle direct orderbook updates (new Phemex format)."""
         phemex_symbol = message.get('symbol')
         book_data = message.get('book', {})
@@ -103,41 +119,40 @@ class PhemexExchange(BaseExchange):
         bids = book_data.get('bids', [])
         asks = book_data.get('asks', [])
         
-        # For incremental updates, we need both bids and asks with actual values
-        valid_bids = [bid for bid in bids if len(bid) >= 2 and bid[1] > 0]
-        valid_asks = [ask for ask in asks if len(ask) >= 2 and ask[1] > 0]
+        # For incremental updates, we need both bids and asks with actual values; only the top level is used
+        best_bid_level = _first_live_level(bids)
+        best_ask_level = _first_live_level(asks)
         
-        if not valid_bids or not valid_asks:
-            logger.debug(f"Phemex {phemex_symbol}: Incomplete orderbook data - bids={len(valid_bids)}, asks={len(valid_asks)}")
+        if best_bid_level is None or best_ask_level is None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Phemex %s: Incomplete orderbook data - bids=%d, asks=%d", phemex_symbol,
+                             sum(1 for bid in bids if len(bid) >= 2 and bid[1] > 0),
+                             sum(1 for ask in asks if len(ask) >= 2 and ask[1] > 0))
             return
         
-        # Get symbol-specific scale factor
-        scale = self.scale_factors.get(phemex_symbol, 10000)  # Default to 10000
+        # Get symbol-specific inverse scale factor
+        inv_scale = self._inv_scale.get(phemex_symbol, self._default_inv_scale)
         
         try:
-            # Get best bid and ask (prices are scaled integers)
-            best_bid_raw = valid_bids[0][0]
-            best_ask_raw = valid_asks[0][0]
-            
-            # Scale down to actual prices
-            best_bid = float(best_bid_raw) / scale
-            best_ask = float(best_ask_raw) / scale
+            # Scale down to actual prices (prices are scaled integers)
+            best_bid = float(best_bid_level[0]) * inv_scale
+            best_ask = float(best_ask_level[0]) * inv_scale
             
             # Use mid price as the last price
             price = (best_bid + best_ask) / 2
             timestamp = int(message.get('timestamp', 0)) // 1000000  # Convert nanoseconds to milliseconds
             
-            logger.debug(f"Phemex {phemex_symbol}: price={price:.8f}, bid={best_bid:.8f}, ask={best_ask:.8f}, scale={scale}")
+            logger.debug("Phemex %s: price=%.8f, bid=%.8f, ask=%.8f, inv_scale=%s", phemex_symbol, price, best_bid, best_ask, inv_scale)
             
             price_data = self.format_price_data(symbol, price, best_bid, best_ask, timestamp)
-            logger.debug(f"Phemex emitting price update for {symbol}: {price_data}")
-            self.emit('price_update', price_data)
+            logger.debug("Phemex emitting price update for %s: %s", symbol, price_data)
+            self.publish_price_update(price_data)
             
         except (ValueError, TypeError, IndexError) as e:
             logger.error(f"Error processing Phemex price data for {phemex_symbol}: {e}")
-            logger.debug(f"Raw bids: {valid_bids[:3]}, Raw asks: {valid_asks[:3]}")
+            logger.debug("Raw bids: %s, Raw asks: %s", bids[:3], asks[:3])
 
-    async def _handle_price_update(self, message: Dict):
+    def _handle_price_update(self, message: Dict):
         """Handle order book price updates (old format - keeping for compatibility)."""
         params = message.get('params')
         if not params or len(params) < 2:
@@ -156,8 +171,8 @@ class PhemexExchange(BaseExchange):
         if not bids or not asks:
             return
         
-        # Get symbol-specific scale factor
-        scale = self.scale_factors.get(phemex_symbol, 10000)  # Default to 10000
+        # Get symbol-specific inverse scale factor
+        inv_scale = self._inv_scale.get(phemex_symbol, self._default_inv_scale)
         
         try:
             # Get best bid and ask (prices are scaled integers)
@@ -165,37 +180,31 @@ class PhemexExchange(BaseExchange):
             best_ask_raw = asks[0][0] if asks[0] and len(asks[0]) > 0 else 0
             
             if best_bid_raw == 0 or best_ask_raw == 0:
-                logger.debug(f"Phemex {phemex_symbol}: Missing bid or ask data")
+                logger.debug("Phemex %s: Missing bid or ask data", phemex_symbol)
                 return
             
             # Scale down to actual prices
-            best_bid = float(best_bid_raw) / scale
-            best_ask = float(best_ask_raw) / scale
+            best_bid = float(best_bid_raw) * inv_scale
+            best_ask = float(best_ask_raw) * inv_scale
             
             # Use mid price as the last price
             price = (best_bid + best_ask) / 2
-            timestamp = int(book_data.get('timestamp', 0))
+            timestamp = book_data.get('timestamp', 0)
+            if timestamp.__class__ is not int:
+                timestamp = int(timestamp)
             
-            logger.debug(f"Phemex {phemex_symbol}: price={price:.8f}, bid={best_bid:.8f}, ask={best_ask:.8f}, scale={scale}")
+            logger.debug("Phemex %s: price=%.8f, bid=%.8f, ask=%.8f", phemex_symbol, price, best_bid, best_ask)
             
             price_data = self.format_price_data(symbol, price, best_bid, best_ask, timestamp)
-            self.emit('price_update', price_data)
+            self.publish_price_update(price_data)
             
         except (ValueError, TypeError, IndexError) as e:
             logger.error(f"Error processing Phemex price data for {phemex_symbol}: {e}")
-            logger.debug(f"Raw bids: {bids[:3] if bids else []}, Raw asks: {asks[:3] if asks else []}")
+            logger.debug("Raw bids: %s, Raw asks: %s", bids[:3] if bids else [], asks[:3] if asks else [])
     
-    def get_ping_message(self) -> Optional[Dict]:
-        message = {
-            'id': self.req_id,
-            'method': 'server.ping',
-            'params': []
-        }
-        self.req_id += 1
-        return message
+    def get_ping_message(self) -> Optional[str]:
+        return _PING_TEMPLATE % next(self._ids)
     
     def normalize_symbol(self, symbol: str) -> str:
         """Normalize symbol format - preserve case for cETHUSD."""
-        if symbol.startswith('c') and symbol.endswith('USD'):
-            return symbol  # Keep original case for perpetual contracts like cETHUSD
-        return symbol.upper()
\ No newline at end of file
+        return _normalize_symbol(symbol)
\ No newline at end of file
@@ -1,74 +1,251 @@
 import asyncio
+import heapq
 import time
 import logging
-from typing import Dict, List, Optional, Any, Tuple
-from collections import defaultdict
+from typing import Callable, Dict, List, NamedTuple, Optional, Any, Tuple
+from collections import OrderedDict, defaultdict
+
+import numpy as np
+
+from .exchanges.base_exchange import PriceUpdate
 
 logger = logging.getLogger(__name__)
 
+# With fewer exchanges per symbol the pairwise loop is cheaper than building the spread matrix
+_VECTORIZE_MIN_EXCHANGES = 8
+
+class PriceEntry(NamedTuple):
+    """Latest price of a symbol on one exchange, as stored by PriceManager."""
+    price: float
+    bid: Optional[float]
+    ask: Optional[float]
+    timestamp: int
+
 class PriceManager:
     def __init__(self):
-        self.prices: Dict[str, Dict[str, Dict]] = {}
-        self.last_updated: Dict[str, float] = {}  # symbol-exchange -> timestamp
-        self.event_callbacks = {}
+        self.prices: Dict[str, Dict[str, PriceEntry]] = {}
+        self.last_updated: Dict[Tuple[str, str], int] = {}  # (symbol, exchange) -> time.monotonic_ns() of last update
+        # event -> (callback, is_coroutine) in registration order; the kind is decided once in on()
+        self.event_callbacks: Dict[str, List[Tuple[Callable, bool]]] = {}
         self.stale_cleanup_task = None
-        self.last_arbitrage_alert: Dict[str, float] = {}  # symbol -> timestamp of last alert
+        # symbol -> time.monotonic() of last alert, oldest alert first; bounded to max_arbitrage_alert_symbols
+        self.last_arbitrage_alert: 'OrderedDict[str, float]' = OrderedDict()
+        self.max_arbitrage_alert_symbols = 10000
         self.arbitrage_alert_cooldown = 300.0  # 5 minutes in seconds
+        # Arbitrage checks are debounced per symbol, so a burst of updates is evaluated once
+        self.arbitrage_check_delay = 0.05
+        self._pending_arbitrage_checks: Dict[str, asyncio.TimerHandle] = {}
+        # One (timestamp_ns, key) entry per last_updated key, oldest first. The timestamp may lag
+        # last_updated; remove_stale_data re-pushes such entries instead of updating them per price.
+        self._update_heap: List[Tuple[int, Tuple[str, str]]] = []
+        # symbol -> (lowest price, its exchange, highest price, its exchange), kept current by update_price
+        self._price_extremes: Dict[str, Tuple[float, str, float, str]] = {}
+        # symbol -> (price, exchange) of the best bid / best ask, absent while no exchange quotes that side
+        self._best_bids: Dict[str, Tuple[float, str]] = {}
+        self._best_asks: Dict[str, Tuple[float, str]] = {}
+        # exchange -> number of symbols it has a price for; maintained on insert and stale removal
+        self._exchange_symbol_counts: Dict[str, int] = {}
+        self._price_count = 0
     
     def on(self, event: str, callback):
         """Register event callback."""
-        if event not in self.event_callbacks:
-            self.event_callbacks[event] = []
-        self.event_callbacks[event].append(callback)
+        self.event_callbacks.setdefault(event, []).append((callback, asyncio.iscoroutinefunction(callback)))
     
     def emit(self, event: str, data: Any):
         """Emit event to registered callbacks."""
-        if event in self.event_callbacks:
-            for callback in self.event_callbacks[event]:
-                try:
-                    if asyncio.iscoroutinefunction(callback):
-                        asyncio.create_task(callback(data))
-                    else:
-                        callback(data)
-                except Exception as e:
-                    logger.error(f"Error in event callback for {event}: {e}")
-    
-    def update_price(self, price_data: Dict):
-        """Update price for a symbol/exchange pair."""
-        symbol = price_data['symbol']
-        exchange = price_data['exchange']
-        
-        logger.debug(f"Price manager received update from {exchange} for {symbol}")
+        callbacks = self.event_callbacks.get(event)
+        if callbacks is None:
+            return
         
-        if symbol not in self.prices:
-            self.prices[symbol] = {}
-        
-        self.prices[symbol][exchange] = {
-            'price': float(price_data['price']),
-            'bid': float(price_data['bid']) if price_data['bid'] is not None else None,
-            'ask': float(price_data['ask']) if price_data['ask'] is not None else None,
-            'timestamp': price_data['timestamp']
-        }
-        
-        self.last_updated[f"{symbol}-{exchange}"] = time.time()
+        for callback, is_coroutine in callbacks:
+            try:
+                if is_coroutine:
+                    asyncio.create_task(callback(data))
+                else:
+                    callback(data)
+            except Exception as e:
+                logger.error(f"Error in event callback for {event}: {e}")
+    
+    def update_price(self, price_data: PriceUpdate) -> bool:
+        """Update price for a symbol/exchange pair. Returns whether the quote changed.
+        
+        The arbitrage check runs arbitrage_check_delay seconds later, once for all updates to the
+        symbol in that window. An update that leaves price, bid and ask unchanged only refreshes
+        the timestamps, without emitting or checking arbitrage.
+        """
+        symbol = price_data.symbol
+        exchange = price_data.exchange
+        
+        logger.debug("Price manager received update from %s for %s", exchange, symbol)
+        
+        symbol_prices = self.prices.get(symbol)
+        if symbol_prices is None:
+            symbol_prices = self.prices[symbol] = {}
+        
+        previous = symbol_prices.get(exchange)
+        entry = symbol_prices[exchange] = PriceEntry(
+            float(price_data.price),
+            float(price_data.bid) if price_data.bid is not None else None,
+            float(price_data.ask) if price_data.ask is not None else None,
+            price_data.timestamp
+        )
+        
+        if previous is None:
+            self._exchange_symbol_counts[exchange] = self._exchange_symbol_counts.get(exchange, 0) + 1
+            self._price_count += 1
+        
+        key = (symbol, exchange)
+        now_ns = time.monotonic_ns()
+        if key not in self.last_updated:
+            heapq.heappush(self._update_heap, (now_ns, key))
+        self.last_updated[key] = now_ns
+        
+        # Deeper book changes often leave the top of book as it was; nothing downstream can change
+        if (previous is not None and previous.price == entry.price
+                and previous.bid == entry.bid and previous.ask == entry.ask):
+            return False
+        
+        self._update_price_extremes(symbol, exchange, entry.price)
+        self._update_best_quotes(symbol, exchange, entry.bid, entry.ask)
+        
+        # Emit price update event; listeners get a plain dict, so only build it when there are any
+        if 'price_update' in self.event_callbacks:
+            self.emit('price_update', {
+                'symbol': symbol,
+                'exchange': exchange,
+                'data': entry._asdict()
+            })
         
-        # Emit price update event
-        self.emit('price_update', {
-            'symbol': symbol,
-            'exchange': exchange,
-            'data': self.prices[symbol][exchange]
-        })
+        self._schedule_arbitrage_check(symbol)
+        return True
+    
+    def update_prices(self, batch: List[PriceUpdate]):
+        """Update prices from a batch of price updates.
+        
+        Only symbols whose quote changed get an arbitrage check, and a pending check covers
+        every update to the symbol in the batch.
+        """
+        update_price = self.update_price
+        for price_data in batch:
+            update_price(price_data)
+    
+    def _schedule_arbitrage_check(self, symbol: str):
+        """Check arbitrage for a symbol after arbitrage_check_delay, unless a check is already pending."""
+        if symbol in self._pending_arbitrage_checks or not self._should_send_arbitrage_alert(symbol):
+            return
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Used outside an event loop, so there is nothing to defer to
+            self._check_arbitrage(symbol)
+            return
+        
+        self._pending_arbitrage_checks[symbol] = loop.call_later(
+            self.arbitrage_check_delay, self._run_arbitrage_check, symbol
+        )
+    
+    def _run_arbitrage_check(self, symbol: str):
+        """Run a scheduled arbitrage check."""
+        del self._pending_arbitrage_checks[symbol]
+        self._check_arbitrage(symbol)
+    
+    def _check_arbitrage(self, symbol: str):
+        """Emit an arbitrage alert for a symbol if opportunities exist and it is not cooling down."""
+        # Nothing would be sent during the cooldown, so don't look for opportunities either
+        if not self._should_send_arbitrage_alert(symbol):
+            return
         
-        # Check for arbitrage opportunities with rate limiting
         opportunities = self.check_arbitrage_opportunities(symbol)  # Uses default 0.1% threshold
-        if opportunities and self._should_send_arbitrage_alert(symbol):
+        if opportunities:
             logger.info(f"Sending arbitrage alert for {symbol} - {len(opportunities)} opportunities found")
             self.emit('arbitrage_opportunity', opportunities)
-            self.last_arbitrage_alert[symbol] = time.time()
+            self._record_arbitrage_alert(symbol)
+    
+    def _record_arbitrage_alert(self, symbol: str):
+        """Remember when a symbol's alert was sent, evicting the oldest alert beyond capacity."""
+        self.last_arbitrage_alert[symbol] = time.monotonic()
+        self.last_arbitrage_alert.move_to_end(symbol)
+        if len(self.last_arbitrage_alert) > self.max_arbitrage_alert_symbols:
+            self.last_arbitrage_alert.popitem(last=False)
+    
+    def _update_price_extremes(self, symbol: str, exchange: str, price: float):
+        """Fold a new price into the symbol's cached lowest/highest prices."""
+        extremes = self._price_extremes.get(symbol)
+        if extremes is None:
+            self._price_extremes[symbol] = (price, exchange, price, exchange)
+            return
+        
+        low, low_exchange, high, high_exchange = extremes
+        if (exchange == low_exchange and price > low) or (exchange == high_exchange and price < high):
+            # The exchange holding an extreme moved inwards, so another exchange may hold it now
+            self._rescan_price_extremes(symbol)
+            return
+        
+        if price < low:
+            low, low_exchange = price, exchange
+        if price > high:
+            high, high_exchange = price, exchange
+        self._price_extremes[symbol] = (low, low_exchange, high, high_exchange)
+    
+    def _rescan_price_extremes(self, symbol: str):
+        """Recompute a symbol's cached lowest/highest prices from all of its exchanges."""
+        prices = self.prices.get(symbol)
+        if not prices:
+            self._price_extremes.pop(symbol, None)
+            return
+        
+        low_exchange = min(prices, key=lambda exchange: prices[exchange].price)
+        high_exchange = max(prices, key=lambda exchange: prices[exchange].price)
+        self._price_extremes[symbol] = (
+            prices[low_exchange].price, low_exchange,
+            prices[high_exchange].price, high_exchange
+        )
+    
+    def _update_best_quotes(self, symbol: str, exchange: str, bid: Optional[float], ask: Optional[float]):
+        """Fold an exchange's new bid/ask into the symbol's cached best bid and best ask."""
+        best_bid = self._best_bids.get(symbol)
+        best_ask = self._best_asks.get(symbol)
+        
+        # A worsened holder or a tie can hand the best to another exchange (ties go to the earliest
+        # exchange in prices order), so those cases fall back to a rescan
+        if best_bid is None or (bid is not None and bid > best_bid[0]):
+            if bid is not None:
+                self._best_bids[symbol] = (bid, exchange)
+        elif best_bid[1] == exchange and bid is not None and bid >= best_bid[0]:
+            self._best_bids[symbol] = (bid, exchange)
+        elif best_bid[1] == exchange or bid == best_bid[0]:
+            self._rescan_best_quotes(symbol)
+            return
+        
+        if best_ask is None or (ask is not None and ask < best_ask[0]):
+            if ask is not None:
+                self._best_asks[symbol] = (ask, exchange)
+        elif best_ask[1] == exchange and ask is not None and ask <= best_ask[0]:
+            self._best_asks[symbol] = (ask, exchange)
+        elif best_ask[1] == exchange or ask == best_ask[0]:
+            self._rescan_best_quotes(symbol)
+    
+    def _rescan_best_quotes(self, symbol: str):
+        """Recompute a symbol's cached best bid and best ask from all of its exchanges."""
+        best_bid = None
+        best_ask = None
+        
+        for exchange, data in self.prices.get(symbol, {}).items():
+            if data.bid is not None and (best_bid is None or data.bid > best_bid[0]):
+                best_bid = (data.bid, exchange)
+            if data.ask is not None and (best_ask is None or data.ask < best_ask[0]):
+                best_ask = (data.ask, exchange)
+        
+        for cache, best in ((self._best_bids, best_bid), (self._best_asks, best_ask)):
+            if best is None:
+                cache.pop(symbol, None)
+            else:
+                cache[symbol] = best
     
     def _should_send_arbitrage_alert(self, symbol: str) -> bool:
         """Check if an arbitrage alert should be sent for this symbol."""
-        now = time.time()
+        now = time.monotonic()
         last_alert_time = self.last_arbitrage_alert.get(symbol)
         
         # If no previous alert or cooldown period has passed, send alert
@@ -79,7 +256,7 @@ class PriceManager:
     
     def get_arbitrage_alert_status(self, symbol: str) -> Dict:
         """Get arbitrage alert status for a symbol."""
-        now = time.time()
+        now = time.monotonic()
         last_alert_time = self.last_arbitrage_alert.get(symbol)
         
         if last_alert_time is None:
@@ -98,7 +275,7 @@ class PriceManager:
         return {
             'symbol': symbol,
             'can_send_alert': can_send,
-            'last_alert_time': last_alert_time,
+            'last_alert_time': time.time() - time_since_last,  # Reported as wall-clock time
             'seconds_since_last_alert': time_since_last,
             'seconds_until_next_alert': seconds_until_next,
             'cooldown_seconds': self.arbitrage_alert_cooldown
@@ -107,36 +284,54 @@ class PriceManager:
     def get_prices_by_symbol(self, symbol: str) -> Optional[Dict[str, Dict]]:
         """Get all exchange prices for a symbol."""
         symbol = symbol.upper()
-        return self.prices.get(symbol, {}).copy() if symbol in self.prices else None
+        prices = self.prices.get(symbol)
+        return {exchange: entry._asdict() for exchange, entry in prices.items()} if prices is not None else None
+    
+    def _prices_view(self, symbol: str) -> Optional[Dict[str, PriceEntry]]:
+        """Get the live exchange prices for a symbol; callers must not mutate the result."""
+        return self.prices.get(symbol.upper())
     
     def get_spread(self, symbol: str, exchange1: str, exchange2: str) -> Optional[Dict]:
         """Calculate spread between two exchanges for a symbol."""
-        prices = self.get_prices_by_symbol(symbol)
+        prices = self._prices_view(symbol)
         if not prices or exchange1 not in prices or exchange2 not in prices:
             return None
         
-        price1 = prices[exchange1]['price']
-        price2 = prices[exchange2]['price']
+        data1 = prices[exchange1]
+        data2 = prices[exchange2]
+        higher, lower, higher_price, lower_price = self._order_pair(exchange1, data1.price, exchange2, data2.price)
         
-        spread = abs(price1 - price2)
-        min_price = min(price1, price2)
-        spread_percentage = (spread / min_price) * 100 if min_price > 0 else 0
+        spread = higher_price - lower_price
+        spread_percentage = (spread / lower_price) * 100 if lower_price > 0 else 0
         
         return {
             'symbol': symbol,
             'exchanges': [exchange1, exchange2],
             'spread': spread,
             'spread_percentage': spread_percentage,
-            'higher': exchange1 if price1 > price2 else exchange2,
-            'lower': exchange1 if price1 < price2 else exchange2,
-            'higher_price': max(price1, price2),
-            'lower_price': min_price,
-            'timestamp': max(prices[exchange1]['timestamp'], prices[exchange2]['timestamp'])
+            'higher': higher,
+            'lower': lower,
+            'higher_price': higher_price,
+            'lower_price': lower_price,
+            'timestamp': max(data1.timestamp, data2.timestamp)
         }
     
+    @staticmethod
+    def _order_pair(exchange1: str, price1: float, exchange2: str, price2: float) -> Tuple[str, str, float, float]:
+        """Return (higher exchange, lower exchange, higher price, lower price) for two quotes."""
+        if price1 > price2:
+            return exchange1, exchange2, price1, price2
+        if price1 < price2:
+            return exchange2, exchange1, price2, price1
+        # Equal prices report exchange2 on both sides
+        return exchange2, exchange2, price2, price1
+    
     def get_all_prices(self) -> Dict[str, Dict[str, Dict]]:
         """Get all prices for all symbols."""
-        return {symbol: exchanges.copy() for symbol, exchanges in self.prices.items()}
+        return {
+            symbol: {exchange: entry._asdict() for exchange, entry in exchanges.items()}
+            for symbol, exchanges in self.prices.items()
+        }
     
     def get_symbols(self) -> List[str]:
         """Get list of all symbols."""
@@ -144,40 +339,27 @@ class PriceManager:
     
     def get_exchanges(self) -> List[str]:
         """Get list of all active exchanges."""
-        exchanges = set()
-        for symbol_data in self.prices.values():
-            exchanges.update(symbol_data.keys())
-        return list(exchanges)
+        return list(self._exchange_symbol_counts)
     
     def get_best_prices(self, symbol: str) -> Optional[Dict]:
         """Get best bid/ask prices across all exchanges for a symbol."""
-        prices = self.get_prices_by_symbol(symbol)
+        prices = self._prices_view(symbol)
         if not prices:
             return None
         
+        # Best quotes are maintained by update_price; only the timestamps are read from the entries
         best_bid = None
         best_ask = None
-        best_bid_exchange = None
-        best_ask_exchange = None
-        
-        for exchange, data in prices.items():
-            if data['bid'] is not None:
-                if best_bid is None or data['bid'] > best_bid['price']:
-                    best_bid = {
-                        'price': data['bid'],
-                        'exchange': exchange,
-                        'timestamp': data['timestamp']
-                    }
-                    best_bid_exchange = exchange
-            
-            if data['ask'] is not None:
-                if best_ask is None or data['ask'] < best_ask['price']:
-                    best_ask = {
-                        'price': data['ask'],
-                        'exchange': exchange,
-                        'timestamp': data['timestamp']
-                    }
-                    best_ask_exchange = exchange
+        
+        cached_bid = self._best_bids.get(symbol.upper())
+        if cached_bid is not None:
+            bid, exchange = cached_bid
+            best_bid = {'price': bid, 'exchange': exchange, 'timestamp': prices[exchange].timestamp}
+        
+        cached_ask = self._best_asks.get(symbol.upper())
+        if cached_ask is not None:
+            ask, exchange = cached_ask
+            best_ask = {'price': ask, 'exchange': exchange, 'timestamp': prices[exchange].timestamp}
         
         spread = None
         spread_percentage = None
@@ -195,94 +377,192 @@ class PriceManager:
         }
     
     def check_arbitrage_opportunities(self, symbol: str, min_spread_percentage: float = 0.1) -> List[Dict]:
-        """Check for arbitrage opportunities for a symbol."""
-        prices = self.get_prices_by_symbol(symbol)
+        """Check for arbitrage opportunities for a symbol.
+        
+        The widest spread of any exchange pair is between the lowest and highest price, so the
+        pairwise scan is skipped when even that spread is below the threshold.
+        """
+        extremes = self._price_extremes.get(symbol)
+        if extremes is not None:
+            low, _, high, _ = extremes
+            if low > 0 and ((high - low) / low) * 100 < min_spread_percentage:
+                return []
+        
+        return self.check_arbitrage_opportunities_full(symbol, min_spread_percentage)
+    
+    def check_arbitrage_opportunities_full(self, symbol: str, min_spread_percentage: float = 0.1) -> List[Dict]:
+        """Check every exchange pair of a symbol for arbitrage opportunities."""
+        prices = self._prices_view(symbol)
         if not prices or len(prices) < 2:
             return []
         
         exchanges = list(prices.keys())
         opportunities = []
         
-        for i in range(len(exchanges)):
-            for j in range(i + 1, len(exchanges)):
-                spread = self.get_spread(symbol, exchanges[i], exchanges[j])
-                if spread and spread['spread_percentage'] >= min_spread_percentage:
-                    opportunities.append({
-                        **spread,
-                        'profitable': True,
-                        'buy_exchange': spread['lower'],
-                        'sell_exchange': spread['higher'],
-                        'potential_profit': spread['spread_percentage']
-                    })
+        if len(exchanges) > _VECTORIZE_MIN_EXCHANGES:
+            pairs = self._candidate_pairs(prices, exchanges, min_spread_percentage)
+        else:
+            pairs = ((i, j) for i in range(len(exchanges)) for j in range(i + 1, len(exchanges)))
+        
+        for i, j in pairs:
+            opportunity = self._spread_if_profitable(symbol, prices, exchanges[i], exchanges[j], min_spread_percentage)
+            if opportunity:
+                opportunities.append(opportunity)
         
         return sorted(opportunities, key=lambda x: x['potential_profit'], reverse=True)
     
+    def check_all_arbitrage_opportunities(self, min_spread_percentage: float = 0.1) -> List[Dict]:
+        """Check all symbols for arbitrage opportunities, most profitable first."""
+        if not self._price_extremes:
+            return []
+        
+        symbols = list(self._price_extremes)
+        extremes = self._price_extremes.values()
+        lows = np.fromiter((low for low, _, _, _ in extremes), dtype=np.float64, count=len(symbols))
+        highs = np.fromiter((high for _, _, high, _ in extremes), dtype=np.float64, count=len(symbols))
+        
+        # The lowest-to-highest screen of check_arbitrage_opportunities, for every symbol at once
+        with np.errstate(divide='ignore', invalid='ignore'):
+            screened_out = (lows > 0) & (((highs - lows) / lows) * 100 < min_spread_percentage)
+        
+        opportunities = []
+        for index in np.flatnonzero(~screened_out).tolist():
+            opportunities.extend(self.check_arbitrage_opportunities_full(symbols[index], min_spread_percentage))
+        
+        return sorted(opportunities, key=lambda x: x['potential_profit'], reverse=True)
+    
+    def _candidate_pairs(self, prices: Dict[str, PriceEntry], exchanges: List[str], min_spread_percentage: float) -> List[Tuple[int, int]]:
+        """Find the (i, j), i < j, exchange index pairs whose spread meets the threshold using NumPy."""
+        values = np.fromiter((prices[exchange].price for exchange in exchanges), dtype=np.float64, count=len(exchanges))
+        
+        spreads = np.abs(values[:, None] - values[None, :])
+        min_prices = np.minimum.outer(values, values)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            spread_percentages = np.where(min_prices > 0, (spreads / min_prices) * 100, 0.0)
+        
+        # Row-major order matches the nested loop, so equal-profit ties sort the same way
+        rows, cols = np.nonzero(np.triu(spread_percentages >= min_spread_percentage, k=1))
+        return list(zip(rows.tolist(), cols.tolist()))
+    
+    def _spread_if_profitable(self, symbol: str, prices: Dict[str, PriceEntry], exchange1: str, exchange2: str,
+                              min_spread_percentage: float) -> Optional[Dict]:
+        """Build the arbitrage opportunity for an exchange pair, or None if its spread is below the threshold."""
+        data1 = prices[exchange1]
+        data2 = prices[exchange2]
+        higher, lower, higher_price, lower_price = self._order_pair(exchange1, data1.price, exchange2, data2.price)
+        
+        spread = higher_price - lower_price
+        spread_percentage = (spread / lower_price) * 100 if lower_price > 0 else 0
+        if spread_percentage < min_spread_percentage:
+            return None
+        
+        return {
+            'symbol': symbol,
+            'exchanges': [exchange1, exchange2],
+            'spread': spread,
+            'spread_percentage': spread_percentage,
+            'higher': higher,
+            'lower': lower,
+            'higher_price': higher_price,
+            'lower_price': lower_price,
+            'timestamp': max(data1.timestamp, data2.timestamp),
+            'profitable': True,
+            'buy_exchange': lower,
+            'sell_exchange': higher,
+            'potential_profit': spread_percentage
+        }
+    
     def get_market_summary(self) -> Dict:
         """Get market summary statistics."""
         symbols = self.get_symbols()
         exchanges = self.get_exchanges()
         
-        price_count = sum(len(exchange_data) for exchange_data in self.prices.values())
-        
         return {
             'total_symbols': len(symbols),
             'total_exchanges': len(exchanges),
             'symbols': symbols,
             'exchanges': exchanges,
             'last_update': time.time(),
-            'price_count': price_count
+            'price_count': self._price_count
         }
     
     def is_stale(self, symbol: str, exchange: str, max_age_seconds: float = 60.0) -> bool:
         """Check if price data is stale."""
-        key = f"{symbol}-{exchange}"
-        last_update = self.last_updated.get(key)
+        last_update = self.last_updated.get((symbol, exchange))
         
         if last_update is None:
             return True
         
-        return (time.time() - last_update) > max_age_seconds
+        return (time.monotonic_ns() - last_update) > int(max_age_seconds * 1e9)
     
     def remove_stale_data(self, max_age_seconds: float = 300.0) -> int:
         """Remove stale price data."""
-        now = time.time()
+        now_ns = time.monotonic_ns()
+        max_age_ns = int(max_age_seconds * 1e9)
         stale_keys = []
         
-        for key, timestamp in self.last_updated.items():
-            if (now - timestamp) > max_age_seconds:
+        # Only keys whose heap timestamp has expired are visited; refreshed ones are re-pushed
+        heap = self._update_heap
+        last_updated = self.last_updated
+        heappop, heappush = heapq.heappop, heapq.heappush
+        while heap and (now_ns - heap[0][0]) > max_age_ns:
+            _, key = heappop(heap)
+            timestamp_ns = last_updated[key]
+            if (now_ns - timestamp_ns) > max_age_ns:
                 stale_keys.append(key)
+            else:
+                heappush(heap, (timestamp_ns, key))
         
         removed_count = 0
         symbols_to_remove = set()
+        changed_symbols = set()
+        exchange_symbol_counts = self._exchange_symbol_counts
         
         for key in stale_keys:
-            symbol, exchange = key.split('-', 1)
+            symbol, exchange = key
+            del last_updated[key]
+            
+            symbol_prices = self.prices.get(symbol)
+            if symbol_prices is None or symbol_prices.pop(exchange, None) is None:
+                continue
+            
+            removed_count += 1
+            changed_symbols.add(symbol)
             
-            if symbol in self.prices and exchange in self.prices[symbol]:
-                del self.prices[symbol][exchange]
-                removed_count += 1
-                
-                # Remove symbol if no exchanges left
-                if not self.prices[symbol]:
-                    del self.prices[symbol]
-                    symbols_to_remove.add(symbol)
+            count = exchange_symbol_counts[exchange] - 1
+            if count:
+                exchange_symbol_counts[exchange] = count
+            else:
+                del exchange_symbol_counts[exchange]
             
-            del self.last_updated[key]
+            # Remove symbol if no exchanges left
+            if not symbol_prices:
+                del self.prices[symbol]
+                symbols_to_remove.add(symbol)
+        
+        self._price_count -= removed_count
+        
+        # Rescan each affected symbol once, however many of its exchanges went stale
+        for symbol in changed_symbols:
+            self._rescan_price_extremes(symbol)
+            self._rescan_best_quotes(symbol)
         
         # Clean up arbitrage alert timestamps for removed symbols
         for symbol in symbols_to_remove:
             if symbol in self.last_arbitrage_alert:
                 del self.last_arbitrage_alert[symbol]
         
-        # Also clean up very old arbitrage alert timestamps (older than 1 hour)
+        # Also clean up very old arbitrage alert timestamps (older than 1 hour); they are kept
+        # oldest first, so only the expired front of the dict is visited
+        now = time.monotonic()
         alert_cleanup_age = 3600.0  # 1 hour
         stale_alert_symbols = []
-        for symbol, timestamp in self.last_arbitrage_alert.items():
-            if (now - timestamp) > alert_cleanup_age:
-                stale_alert_symbols.append(symbol)
-        
-        for symbol in stale_alert_symbols:
-            del self.last_arbitrage_alert[symbol]
+        while self.last_arbitrage_alert:
+            symbol, timestamp = next(iter(self.last_arbitrage_alert.items()))
+            if (now - timestamp) <= alert_cleanup_age:
+                break
+            self.last_arbitrage_alert.popitem(last=False)
+            stale_alert_symbols.append(symbol)
         
         if removed_count > 0:
             logger.info(f"Removed {removed_count} stale price entries")
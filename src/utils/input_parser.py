@@ -1,9 +1,12 @@
-import json
+import asyncio
 import csv
 import os
+import sys
+from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List, Tuple, Set
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -17,35 +20,45 @@ class InputParser:
         file_extension = Path(file_path).suffix.lower()
         
         if file_extension == '.csv':
-            return await InputParser._parse_csv(file_path)
+            parser = InputParser._parse_csv
         elif file_extension == '.json':
-            return await InputParser._parse_json(file_path)
+            parser = InputParser._parse_json
         elif file_extension == '.txt':
-            return await InputParser._parse_txt(file_path)
+            parser = InputParser._parse_txt
         else:
             raise ValueError(f"Unsupported file format: {file_extension}. Supported formats: .csv, .json, .txt")
+        
+        # Parsers do blocking file I/O, so run them off the event loop (to_thread needs Python 3.9)
+        return await asyncio.get_running_loop().run_in_executor(None, parser, file_path)
     
     @staticmethod
-    async def _parse_csv(file_path: str) -> Dict:
+    def _parse_csv(file_path: str) -> Dict:
         """Parse CSV file format."""
         results = []
-        exchange_symbols: Dict[str, Set[str]] = {}
+        exchange_symbols: Dict[str, Set[str]] = defaultdict(set)
         
         try:
             with open(file_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
+                reader = csv.reader(file)
+                header = next(reader, [])
+                
+                # Resolve the columns once; a missing column reads as empty, like a missing field
+                exchange_idx = header.index('exchange') if 'exchange' in header else None
+                symbol_idx = header.index('symbol') if 'symbol' in header else None
                 
                 for row_num, row in enumerate(reader, start=2):
-                    exchange = row.get('exchange', '').strip().lower()
-                    symbol = row.get('symbol', '').strip().upper()
+                    if not row:
+                        continue
+                    
+                    exchange = row[exchange_idx].strip().lower() if exchange_idx is not None and exchange_idx < len(row) else ''
+                    symbol = row[symbol_idx].strip().upper() if symbol_idx is not None and symbol_idx < len(row) else ''
                     
                     if not exchange or not symbol:
                         logger.warning(f"Skipping invalid row {row_num}: {row}")
                         continue
                     
-                    if exchange not in exchange_symbols:
-                        exchange_symbols[exchange] = set()
-                    
+                    # Interned, so every price update keyed by these strings reuses one object
+                    exchange, symbol = sys.intern(exchange), sys.intern(symbol)
                     exchange_symbols[exchange].add(symbol)
                     results.append({'exchange': exchange, 'symbol': symbol})
             
@@ -58,17 +71,17 @@ class InputParser:
             raise ValueError(f"Failed to parse CSV file: {str(e)}")
     
     @staticmethod
-    async def _parse_json(file_path: str) -> Dict:
+    def _parse_json(file_path: str) -> Dict:
         """Parse JSON file format."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                data = json.load(file)
+            with open(file_path, 'rb') as file:
+                data = orjson.loads(file.read())
             
             if not isinstance(data, list):
                 raise ValueError('JSON file must contain an array of exchange/symbol pairs')
             
             results = []
-            exchange_symbols: Dict[str, Set[str]] = {}
+            exchange_symbols: Dict[str, Set[str]] = defaultdict(set)
             
             for item in data:
                 exchange = item.get('exchange', '').strip().lower()
@@ -78,9 +91,7 @@ class InputParser:
                     logger.warning(f"Skipping invalid entry: {item}")
                     continue
                 
-                if exchange not in exchange_symbols:
-                    exchange_symbols[exchange] = set()
-                
+                exchange, symbol = sys.intern(exchange), sys.intern(symbol)
                 exchange_symbols[exchange].add(symbol)
                 results.append({'exchange': exchange, 'symbol': symbol})
             
@@ -89,17 +100,17 @@ class InputParser:
             
             return {'exchanges': grouped_data, 'pairs': results}
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON format: {str(e)}")
         except Exception as e:
             raise ValueError(f"Failed to parse JSON file: {str(e)}")
     
     @staticmethod
-    async def _parse_txt(file_path: str) -> Dict:
+    def _parse_txt(file_path: str) -> Dict:
         """Parse TXT file format with symbol:ticker:exchange structure."""
         try:
             results = []
-            exchange_symbols: Dict[str, List[Dict[str, str]]] = {}
+            exchange_symbols: Dict[str, List[Dict[str, str]]] = defaultdict(list)
             
             with open(file_path, 'r', encoding='utf-8') as file:
                 for line_num, line in enumerate(file, start=1):
@@ -121,8 +132,7 @@ class InputParser:
                         logger.warning(f"Skipping invalid line {line_num}: empty values in '{line}'")
                         continue
                     
-                    if exchange not in exchange_symbols:
-                        exchange_symbols[exchange] = []
+                    display_symbol, ticker, exchange = sys.intern(display_symbol), sys.intern(ticker), sys.intern(exchange)
                     
                     # Store both display symbol and ticker for each exchange
                     symbol_data = {
@@ -138,7 +148,7 @@ class InputParser:
                     })
             
             return {
-                'exchanges': exchange_symbols, 
+                'exchanges': dict(exchange_symbols), 
                 'pairs': results,
                 'format': 'symbol_ticker'  # Flag to indicate new format
             }
@@ -149,11 +159,12 @@ class InputParser:
     @staticmethod
     def validate_exchange_support(exchanges: Dict, supported_exchanges: List[str]) -> Dict:
         """Filter exchanges to only include supported ones."""
-        unsupported = [ex for ex in exchanges.keys() if ex not in supported_exchanges]
+        supported = frozenset(supported_exchanges)
+        unsupported = [ex for ex in exchanges if ex not in supported]
         
         if unsupported:
             logger.warning(f"Unsupported exchanges will be ignored: {', '.join(unsupported)}")
             logger.warning(f"Supported exchanges: {', '.join(supported_exchanges)}")
         
-        filtered = {ex: symbols for ex, symbols in exchanges.items() if ex in supported_exchanges}
+        filtered = {ex: symbols for ex, symbols in exchanges.items() if ex in supported}
         return filtered
\ No newline at end of file
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+
+# Add the current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.exchanges.mexc_exchange import MexcExchange
+
+
+def _replay(frames):
+    """Feed ticker frames through MEXC's price handler and return the emitted updates."""
+    exchange = MexcExchange()
+    updates = []
+    exchange.on('price_update', updates.append)
+    for data in frames:
+        exchange._handle_price_update({'channel': 'push.ticker', 'data': data})
+    return updates
+
+
+def test_present_but_empty_field_uses_alternate():
+    """A preferred field that is present but zero, None or empty falls back to its alternate."""
+    frames = [
+        {'symbol': 'BTC_USDT', 'lastPrice': 100, 'bid1': 99, 'ask1': 101, 'timestamp': 1},
+        {'symbol': 'BTC_USDT', 'lastPrice': 0, 'last': 102, 'bid1': 101, 'ask1': 103, 'timestamp': 2},
+        {'symbol': 'BTC_USDT', 'lastPrice': None, 'last': 104, 'bid1': 103, 'ask1': 105, 'timestamp': 3},
+        {'symbol': 'BTC_USDT', 'lastPrice': '', 'last': 106, 'bidPrice': 105, 'bid1': 0, 'ask1': 107, 'timestamp': 4},
+        {'symbol': 'BTC_USDT', 'lastPrice': 108, 'bid1': 107, 'ask1': 109, 'timestamp': 5},
+    ]
+    updates = _replay(frames)
+    assert [u.price for u in updates] == [100.0, 102.0, 104.0, 106.0, 108.0], updates
+    assert updates[3].bid == 105.0, updates[3]
+
+
+def test_all_alternates_empty_is_dropped():
+    """A frame with no usable value for a field is still dropped."""
+    updates = _replay([{'symbol': 'BTC_USDT', 'lastPrice': 0, 'last': 0, 'bid1': 99, 'ask1': 101}])
+    assert updates == [], updates
+
+
+if __name__ == "__main__":
+    test_present_but_empty_field_uses_alternate()
+    test_all_alternates_empty_is_dropped()
+    print("✅ MEXC price field tests passed")
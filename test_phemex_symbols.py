@@ -3,6 +3,7 @@
 import asyncio
 import websockets
 import json
+import orjson
 import logging
 
 # Set up logging
@@ -27,24 +28,24 @@ async def test_phemex_symbols():
         async with websockets.connect(uri) as websocket:
             logger.info(f"Connected to Phemex WebSocket: {uri}")
             
-            # Subscribe to each symbol
+            # Subscribe to every symbol at once; responses are matched by id below
+            messages = []
             for i, symbol in enumerate(symbols_to_test):
-                message = {
+                messages.append({
                     'id': i + 10,
                     'method': 'orderbook.subscribe',
                     'params': [symbol, 20]
-                }
-                
+                })
                 logger.info(f"Testing symbol: {symbol}")
-                await websocket.send(json.dumps(message))
-                await asyncio.sleep(0.5)  # Wait a bit between subscriptions
+            
+            await asyncio.gather(*(websocket.send(json.dumps(message)) for message in messages))
             
             # Listen for responses
             message_count = 0
             while message_count < 20:  # Listen for responses
                 try:
                     response = await asyncio.wait_for(websocket.recv(), timeout=15.0)
-                    message = json.loads(response)
+                    message = orjson.loads(response)
                     
                     message_count += 1
                     
@@ -3,6 +3,7 @@
 import asyncio
 import websockets
 import json
+import orjson
 import logging
 
 # Set up logging
@@ -34,7 +35,7 @@ async def test_phemex_wait():
             while (asyncio.get_event_loop().time() - start_time) < 60:  # Wait up to 60 seconds
                 try:
                     response = await asyncio.wait_for(websocket.recv(), timeout=5.0)
-                    message = json.loads(response)
+                    message = orjson.loads(response)
                     
                     # Check for subscription confirmation
                     if message.get('id') == 100:
@@ -9,6 +9,7 @@ from pathlib import Path
 logging.getLogger().setLevel(logging.CRITICAL)
 
 from main import CryptoFuturesPriceFetcher
+from src.exchanges.base_exchange import PriceUpdate
 
 async def test_application():
     """Test the application components."""
@@ -39,14 +40,14 @@ async def test_application():
         
         # Test 4: Price manager functionality
         pm = fetcher.price_manager
-        test_price = {
-            'symbol': 'BTCUSDT',
-            'exchange': 'test',
-            'price': 50000.0,
-            'bid': 49999.0,
-            'ask': 50001.0,
-            'timestamp': 1234567890
-        }
+        test_price = PriceUpdate(
+            exchange='test',
+            symbol='BTCUSDT',
+            price=50000.0,
+            bid=49999.0,
+            ask=50001.0,
+            timestamp=1234567890
+        )
         
         pm.update_price(test_price)
         prices = pm.get_prices_by_symbol('BTCUSDT')